@@ -19,9 +19,10 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import Iterator
 import getpass
-import json
 
+from . import json_utils
 from .config import Config
 from .migrator import GitHubMigrator
 from .label_manager import Label
@@ -38,6 +39,28 @@ def setup_logging(level: str):
     logging.getLogger().setLevel(getattr(logging, level.upper()))
 
 
+def iter_labels(path: Path) -> Iterator[Label]:
+    """
+    Lazily read label definitions from a JSON array file.
+    
+    Uses ijson to stream the array when it is installed, so very large
+    label files are never fully loaded into memory.
+    
+    Args:
+        path: Path to JSON file containing a list of label objects
+    
+    Yields:
+        Label definitions in file order
+    """
+    with open(path, 'rb') as f:
+        for item in json_utils.iter_items(f):
+            yield Label(
+                name=item["name"],
+                color=item["color"],
+                description=item.get("description", "")
+            )
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -64,13 +87,20 @@ def main():
         help="Logging level (default: INFO)"
     )
     
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Number of concurrent API workers (overrides processing.max_workers)"
+    )
+    
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
     
     # Extract command
     extract_parser = subparsers.add_parser("extract", help="Extract issues from a project")
     extract_parser.add_argument("--project-id", required=True, help="Source project node ID")
-    extract_parser.add_argument("--output", type=Path, required=True, help="Output Excel file path")
+    extract_parser.add_argument("--output", type=Path, required=True, help="Output Excel (or .parquet) file path")
     extract_parser.add_argument("--limit", type=int, help="Maximum number of issues to extract")
+    extract_parser.add_argument("--batch-size", type=int, help="Project items fetched per request (max 100)")
     
     # Map command
     map_parser = subparsers.add_parser("map", help="Map field values to GitHub IDs")
@@ -86,6 +116,7 @@ def main():
     rel_parser = subparsers.add_parser("relationships", help="Migrate issue relationships")
     rel_parser.add_argument("--input", type=Path, required=True, help="Input Excel file path")
     rel_parser.add_argument("--output", type=Path, help="Output results Excel file path")
+    rel_parser.add_argument("--edges-file", type=Path, help="JSON file of processed relationships to skip and update")
     
     # Migrate labels command
     labels_parser = subparsers.add_parser("labels", help="Migrate labels to repository")
@@ -115,6 +146,9 @@ def main():
         logger.warning(f"Config file not found: {args.config}. Using defaults.")
         config = Config()
     
+    if args.max_workers is not None:
+        config.processing.max_workers = args.max_workers
+    
     # Override token if provided
     if args.token:
         config.github.token = args.token
@@ -133,7 +167,8 @@ def main():
             migrator.extract_issues(
                 project_id=args.project_id,
                 output_path=args.output,
-                limit=args.limit
+                limit=args.limit,
+                page_size=args.batch_size
             )
         
         elif args.command == "map":
@@ -157,7 +192,8 @@ def main():
         elif args.command == "relationships":
             summary = migrator.migrate_relationships(
                 input_path=args.input,
-                output_path=args.output
+                output_path=args.output,
+                edges_path=args.edges_file
             )
             print(f"\nRelationships Summary:")
             print(f"  Total rows: {summary['total']}")
@@ -166,34 +202,23 @@ def main():
                 print(f"  Errors: {len(summary['errors'])}")
         
         elif args.command == "labels":
-            with open(args.input, 'r', encoding='utf-8') as f:
-                labels_data = json.load(f)
-            
-            labels = [
-                Label(
-                    name=item["name"],
-                    color=item["color"],
-                    description=item.get("description", "")
-                )
-                for item in labels_data
-            ]
-            
-            summary = migrator.migrate_labels(labels)
+            summary = migrator.migrate_labels(iter_labels(args.input))
             print(f"\nLabels Summary:")
             print(f"  Total: {summary['total']}")
             print(f"  Success: {summary['success']}")
             print(f"  Failed: {summary['failed']}")
             
             if args.output:
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    json.dump(summary, f, indent=2)
+                json_utils.dump_file(summary, args.output)
         
         elif args.command == "full":
             output_dir = args.output_dir or Path(config.processing.output_directory)
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Step 1: Map fields if needed
-            mapped_path = output_dir / "mapped_issues.xlsx"
+            # Step 1: Map fields if needed (Parquet is much faster to round-trip
+            # for this intermediate file when pyarrow is installed)
+            mapped_suffix = ".parquet" if migrator.excel.supports_parquet() else ".xlsx"
+            mapped_path = output_dir / f"mapped_issues{mapped_suffix}"
             logger.info("Step 1: Mapping fields...")
             migrator.map_fields(
                 input_path=args.migrate_input,
@@ -212,25 +237,14 @@ def main():
                 logger.info("Step 3: Migrating relationships...")
                 rel_summary = migrator.migrate_relationships(
                     input_path=args.relationships_input,
-                    output_path=output_dir / "relationships_results.xlsx"
+                    output_path=output_dir / "relationships_results.xlsx",
+                    edges_path=output_dir / "processed_relationships.json"
                 )
             
             # Step 4: Migrate labels if provided
             if args.labels_input:
                 logger.info("Step 4: Migrating labels...")
-                with open(args.labels_input, 'r', encoding='utf-8') as f:
-                    labels_data = json.load(f)
-                
-                labels = [
-                    Label(
-                        name=item["name"],
-                        color=item["color"],
-                        description=item.get("description", "")
-                    )
-                    for item in labels_data
-                ]
-                
-                labels_summary = migrator.migrate_labels(labels)
+                labels_summary = migrator.migrate_labels(iter_labels(args.labels_input))
             
             print(f"\nFull Migration Complete!")
             print(f"  Issues: {issues_summary['success']}/{issues_summary['total']} successful")
@@ -7,6 +7,8 @@ This module provides utilities for reading and writing Excel files used in
 the GitHub migration process. It handles:
 - Reading Excel files with multiple sheets
 - Writing DataFrames to Excel files with multiple sheets
+- Streaming plain row records to Excel without building a DataFrame
+- Reading and writing single tables as Parquet for intermediate files
 - Finding sheets by name (with fuzzy matching support)
 - Parsing and joining multi-value fields (using separators like "||")
 - Sanitizing text for Excel compatibility (removing illegal XML characters)
@@ -16,17 +18,69 @@ The ExcelHandler class is used throughout the migration process to read
 source data and write migration results.
 """
 
+import re
 import logging
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
+
+# pandas is imported lazily so commands that never touch Excel start fast
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Control characters that are illegal in XML (and therefore in xlsx cells)
+_ILLEGAL_XML_CHARS = str.maketrans(
+    "", "", "".join(chr(c) for c in [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20)])
+)
+_COLUMN_SEPARATORS_RE = re.compile(r"[ _\-]+")
+
+
+def _module_available(name: str) -> bool:
+    """Check whether an optional module can be imported, without importing it."""
+    return importlib.util.find_spec(name) is not None
+
+
+def _default_write_engine() -> str:
+    """Pick the fastest installed Excel writer engine."""
+    return "xlsxwriter" if _module_available("xlsxwriter") else "openpyxl"
+
+
+@lru_cache(maxsize=1)
+def _calamine_available() -> bool:
+    """Check for python_calamine and a pandas that knows the engine (>= 2.2)."""
+    if not _module_available("python_calamine"):
+        return False
+    import pandas as pd
+    version = tuple(int(part) for part in re.findall(r"\d+", pd.__version__)[:2])
+    return version >= (2, 2)
+
+
+def _default_read_engine(file_path: Path) -> str:
+    """Pick the fastest installed Excel reader engine for a file."""
+    # calamine parses both .xlsx and .xls much faster than openpyxl/xlrd
+    # and with far lower peak memory
+    if _calamine_available():
+        return "calamine"
+    return "openpyxl" if file_path.suffix.lower() == ".xlsx" else "xlrd"
+
+
+@lru_cache(maxsize=32)
+def _list_sheet_names(file_path: str, mtime_ns: int) -> List[str]:
+    """List sheet names from workbook metadata (mtime_ns keys the cache)."""
+    import pandas as pd
+    path = Path(file_path)
+    with pd.ExcelFile(path, engine=_default_read_engine(path)) as workbook:
+        return list(workbook.sheet_names)
+
 
 class ExcelHandler:
     """Handles Excel file operations for migration data."""
     
+    __slots__ = ("separator",)
+    
     def __init__(self, multi_value_separator: str = "||"):
         self.separator = multi_value_separator
     
@@ -35,20 +89,23 @@ class ExcelHandler:
         file_path: Path,
         sheet_name: Optional[str] = None,
         engine: Optional[str] = None
-    ) -> Dict[str, pd.DataFrame]:
+    ) -> Dict[str, "pd.DataFrame"]:
         """
         Read Excel file, returning a dictionary of sheet names to DataFrames.
         
         Args:
             file_path: Path to Excel file
             sheet_name: Specific sheet name or None for all sheets
-            engine: Engine to use ('openpyxl' for .xlsx, 'xlrd' for .xls)
+            engine: Engine to use ('calamine' if installed, otherwise
+                'openpyxl' for .xlsx and 'xlrd' for .xls)
         
         Returns:
             Dictionary mapping sheet names to DataFrames
         """
+        import pandas as pd
+        
         if engine is None:
-            engine = "openpyxl" if file_path.suffix.lower() == ".xlsx" else "xlrd"
+            engine = _default_read_engine(file_path)
         
         try:
             if sheet_name:
@@ -62,9 +119,9 @@ class ExcelHandler:
     
     def write_excel(
         self,
-        data: Dict[str, pd.DataFrame],
+        data: Dict[str, "pd.DataFrame"],
         file_path: Path,
-        engine: str = "openpyxl"
+        engine: Optional[str] = None
     ):
         """
         Write multiple DataFrames to an Excel file with multiple sheets.
@@ -72,12 +129,23 @@ class ExcelHandler:
         Args:
             data: Dictionary mapping sheet names to DataFrames
             file_path: Output file path
-            engine: Engine to use
+            engine: Engine to use ('xlsxwriter' if installed, else 'openpyxl')
         """
+        import pandas as pd
+        
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
+        if engine is None:
+            engine = _default_write_engine()
+        
+        # Keep issue URLs as plain strings (Excel caps hyperlinks per sheet).
+        # constant_memory is not usable here: pandas writes column by column.
+        engine_kwargs = None
+        if engine == "xlsxwriter":
+            engine_kwargs = {"options": {"strings_to_urls": False}}
+        
         try:
-            with pd.ExcelWriter(file_path, engine=engine) as writer:
+            with pd.ExcelWriter(file_path, engine=engine, engine_kwargs=engine_kwargs) as writer:
                 for sheet_name, df in data.items():
                     df.to_excel(writer, sheet_name=sheet_name, index=False)
             logger.info(f"Wrote Excel file: {file_path}")
@@ -85,6 +153,141 @@ class ExcelHandler:
             logger.error(f"Failed to write Excel file {file_path}: {e}")
             raise
     
+    @staticmethod
+    def supports_parquet() -> bool:
+        """Check whether Parquet files can be read and written (needs pyarrow)."""
+        return _module_available("pyarrow")
+    
+    def read_dataframe(
+        self,
+        file_path: Path,
+        sheet_name: str = "Issues"
+    ) -> "pd.DataFrame":
+        """
+        Read a single table from a .parquet or Excel file.
+        
+        Args:
+            file_path: Path to .parquet or Excel file
+            sheet_name: Sheet to read from Excel files (matched by name,
+                falling back to the first sheet)
+        
+        Returns:
+            DataFrame with the table contents
+        """
+        if file_path.suffix.lower() == ".parquet":
+            import pandas as pd
+            return pd.read_parquet(file_path, engine="pyarrow")
+        
+        sheets = self.read_excel(file_path)
+        name = self.match_sheet_name(list(sheets.keys()), sheet_name) or list(sheets.keys())[0]
+        return sheets[name]
+    
+    def write_dataframe(
+        self,
+        df: "pd.DataFrame",
+        file_path: Path,
+        sheet_name: str = "Issues"
+    ):
+        """
+        Write a single table to a .parquet or Excel file (chosen by suffix).
+        
+        Parquet is much faster to round-trip than xlsx, so it suits files
+        that are only read back by the migrator itself.
+        
+        Args:
+            df: DataFrame to write
+            file_path: Output .parquet or Excel file path
+            sheet_name: Sheet name when writing Excel
+        """
+        if file_path.suffix.lower() != ".parquet":
+            self.write_excel({sheet_name: df}, file_path)
+            return
+        
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Parquet columns need a single type; spreadsheet columns often mix
+        # numbers and text, so store non-missing object values as strings
+        df = df.copy()
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].map(lambda v: v if v is None or v != v else str(v))
+        
+        try:
+            df.to_parquet(file_path, engine="pyarrow", compression="snappy", index=False)
+            logger.info(f"Wrote Parquet file: {file_path}")
+        except Exception as e:
+            logger.error(f"Failed to write Parquet file {file_path}: {e}")
+            raise
+    
+    def write_records(
+        self,
+        data: Dict[str, List[Dict[str, Any]]],
+        file_path: Path
+    ):
+        """
+        Write lists of row dicts straight to an Excel file, bypassing pandas.
+        
+        Rows are streamed in order, so memory stays flat regardless of the
+        number of rows. Columns are the union of row keys in first-seen order;
+        missing values are left blank.
+        
+        Args:
+            data: Dictionary mapping sheet names to lists of row dicts
+            file_path: Output file path
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        sheets = []
+        for sheet_name, rows in data.items():
+            columns = list(dict.fromkeys(key for row in rows for key in row))
+            sheets.append((sheet_name, columns, rows))
+        
+        try:
+            if _module_available("xlsxwriter"):
+                import xlsxwriter
+                workbook = xlsxwriter.Workbook(
+                    str(file_path),
+                    {"constant_memory": True, "strings_to_urls": False}
+                )
+                try:
+                    for sheet_name, columns, rows in sheets:
+                        worksheet = workbook.add_worksheet(sheet_name)
+                        worksheet.write_row(0, 0, columns)
+                        for row_num, row in enumerate(rows, start=1):
+                            worksheet.write_row(row_num, 0, [row.get(c) for c in columns])
+                finally:
+                    workbook.close()
+            else:
+                from openpyxl import Workbook
+                workbook = Workbook(write_only=True)
+                for sheet_name, columns, rows in sheets:
+                    worksheet = workbook.create_sheet(sheet_name)
+                    worksheet.append(columns)
+                    for row in rows:
+                        worksheet.append([row.get(c) for c in columns])
+                workbook.save(file_path)
+            logger.info(f"Wrote Excel file: {file_path}")
+        except Exception as e:
+            logger.error(f"Failed to write Excel file {file_path}: {e}")
+            raise
+    
+    def list_sheet_names(self, file_path: Path) -> List[str]:
+        """
+        List sheet names without parsing any cell data.
+        
+        Results are cached per file and refreshed when the file changes.
+        
+        Args:
+            file_path: Path to Excel file
+        
+        Returns:
+            List of sheet names in workbook order
+        """
+        try:
+            return list(_list_sheet_names(str(file_path.resolve()), file_path.stat().st_mtime_ns))
+        except Exception as e:
+            logger.error(f"Failed to list sheets in {file_path}: {e}")
+            raise
+    
     def find_sheet_by_name(
         self,
         file_path: Path,
@@ -102,20 +305,47 @@ class ExcelHandler:
         Returns:
             Sheet name if found, None otherwise
         """
-        sheets = self.read_excel(file_path)
+        return self.match_sheet_name(self.list_sheet_names(file_path), target_name, fuzzy)
+    
+    def match_sheet_name(
+        self,
+        sheets: List[str],
+        target_name: str,
+        fuzzy: bool = True
+    ) -> Optional[str]:
+        """
+        Pick a sheet name from a list (exact or fuzzy match).
         
+        Args:
+            sheets: Available sheet names
+            target_name: Target sheet name
+            fuzzy: Use fuzzy matching if exact match not found
+        
+        Returns:
+            Sheet name if found, None otherwise
+        """
         # Try exact match (case-insensitive)
         target_lower = target_name.lower()
-        for sheet in sheets.keys():
+        for sheet in sheets:
             if sheet.lower() == target_lower:
                 return sheet
         
-        # Try fuzzy match
+        # Try fuzzy match (rapidfuzz's C++ scorer when installed)
         if fuzzy:
+            if _module_available("rapidfuzz"):
+                from rapidfuzz import fuzz, process
+                match = process.extractOne(
+                    target_name,
+                    sheets,
+                    scorer=fuzz.ratio,
+                    score_cutoff=60
+                )
+                return match[0] if match else None
+            
             import difflib
             matches = difflib.get_close_matches(
                 target_name,
-                list(sheets.keys()),
+                sheets,
                 n=1,
                 cutoff=0.6
             )
@@ -134,7 +364,8 @@ class ExcelHandler:
         Returns:
             List of non-empty strings
         """
-        if value is None or (isinstance(value, float) and pd.isna(value)):
+        # NaN is the only value not equal to itself
+        if value is None or (isinstance(value, float) and value != value):
             return []
         
         if isinstance(value, list):
@@ -144,11 +375,17 @@ class ExcelHandler:
         if not s:
             return []
         
-        if self.separator in s:
-            parts = [p.strip() for p in s.split(self.separator)]
-            return [p for p in parts if p]
+        # Most cells hold a single value; skip the split entirely for those
+        separator = self.separator
+        if separator not in s:
+            return [s]
         
-        return [s]
+        values = []
+        for part in s.split(separator):
+            part = part.strip()
+            if part:
+                values.append(part)
+        return values
     
     def join_multi_value(self, values: List[str]) -> str:
         """
@@ -162,6 +399,59 @@ class ExcelHandler:
         """
         return self.separator.join([str(v).strip() for v in values if str(v).strip()])
     
+    def parse_multi_value_series(self, values: "pd.Series") -> "pd.Series":
+        """
+        Vectorized parse_multi_value over a whole column.
+        
+        Args:
+            values: Column of cell values
+        
+        Returns:
+            Series of lists of non-empty strings (empty list for blank cells)
+        """
+        parts = values.astype("string").str.strip().str.split(self.separator, regex=False)
+        return parts.map(
+            lambda items: [p.strip() for p in items if p.strip()] if isinstance(items, list) else []
+        )
+    
+    def join_multi_value_series(self, values: "pd.Series") -> "pd.Series":
+        """
+        Vectorized join_multi_value over a column of lists.
+        
+        Args:
+            values: Series of lists of strings
+        
+        Returns:
+            Series of joined strings (empty string for missing lists)
+        """
+        return values.str.join(self.separator).fillna("")
+    
+    def normalize_text_series(self, values: "pd.Series") -> "pd.Series":
+        """
+        Vectorized str(value).strip() over a column, with blank cells as "".
+        
+        Args:
+            values: Column of cell values
+        
+        Returns:
+            Series of stripped strings (empty string for missing cells, not "nan")
+        """
+        return values.astype(object).where(values.notna(), "").astype(str).str.strip()
+    
+    def sanitize_text_series(self, values: "pd.Series") -> "pd.Series":
+        """
+        Vectorized sanitize_text over a column.
+        
+        Args:
+            values: Column of cell values
+        
+        Returns:
+            Series of strings without illegal XML characters (empty string
+            for missing cells)
+        """
+        values = values.astype(object).where(values.notna(), "").astype(str)
+        return values.str.translate(_ILLEGAL_XML_CHARS)
+    
     def sanitize_text(self, value: Any) -> str:
         """
         Sanitize text for Excel compatibility (remove illegal XML characters).
@@ -172,7 +462,6 @@ class ExcelHandler:
         Returns:
             Sanitized string
         """
-        import re
         if value is None:
             return ""
         
@@ -180,8 +469,7 @@ class ExcelHandler:
             value = str(value)
         
         # Remove illegal XML characters
-        illegal_chars = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F]")
-        return illegal_chars.sub("", value)
+        return value.translate(_ILLEGAL_XML_CHARS)
     
     def normalize_column_name(self, name: str) -> str:
         """
@@ -193,6 +481,5 @@ class ExcelHandler:
         Returns:
             Normalized name
         """
-        import re
-        return re.sub(r"[ _\-]+", "", str(name).strip().lower())
+        return _COLUMN_SEPARATORS_RE.sub("", str(name).strip().lower())
 
@@ -19,256 +19,424 @@ into the corresponding GitHub node IDs needed for GraphQL mutations.
 
 import re
 import logging
-from typing import Dict, Any, Optional, List
-import pandas as pd
+from datetime import date, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional, List
 
 from .config import FieldMappingConfig
 
+# pandas is imported lazily; the scalar map_* methods never need it
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_ITERATION_RE = re.compile(r"^\s*iteration\s*(\d+)\s*$", re.I)
+_QUARTER_RE = re.compile(r"^\s*quarter\s*(\d+)\s*$", re.I)
+_NUMBER_RE = re.compile(r"^\s*(\d+)\s*$")
+_GITHUB_URL_RE = re.compile(r"github\.com/([^/\s]+)", re.I)
+_PARENS_RE = re.compile(r"\(.*?\)")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DASH_TRANS = str.maketrans({"–": "-", "—": "-"})
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_USER_TOKEN_SEPARATORS = " ,;:|/-"
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    """Lowercase, fold dashes and collapse whitespace (cached: cell values repeat)."""
+    text = text.strip().lower().translate(_DASH_TRANS)
+    # Only collapse when a run of spaces or other whitespace is present
+    if "  " in text or not text.isprintable():
+        return " ".join(text.split())
+    return text
+
 
 class FieldMapper:
     """Maps text values to GitHub IDs based on configuration."""
     
     def __init__(self, config: FieldMappingConfig):
         self.config = config
-        self._normalized_mappings = self._build_normalized_mappings()
+        self._build_normalized_mappings()
+        
+        # Bind lookups once; the map_* methods run for every cell
+        self._iteration_get = self._iteration_map.get
+        self._quarter_get = self._quarter_map.get
+        self._status_get = self._status_map.get
+        self._team_get = self._team_map.get
+        self._priority_get = self._priority_map.get
+        self._readiness_get = self._readiness_map.get
+        self._effort_get = self._effort_map.get
+        self._milestone_get = self._milestone_map.get
+        self._label_get = self._label_map.get
+        self._user_get = self._user_map.get
+        self._issue_type_get = self._issue_type_map.get
+        
+        # Labels that imply an issue type (only those with a configured type)
+        self._label_issue_types = {
+            label: type_id
+            for label, type_id in (("bug", self._issue_type_get("bug", "")),)
+            if type_id
+        }
     
-    def _build_normalized_mappings(self) -> Dict[str, Dict[str, str]]:
+    def _build_normalized_mappings(self):
         """Build normalized mappings for case-insensitive matching."""
-        return {
-            "status": {self._normalize_key(k): v for k, v in self.config.status_mapping.items()},
-            "team": {self._normalize_key(k): v for k, v in self.config.team_mapping.items()},
-            "priority": {self._normalize_key(k): v for k, v in self.config.priority_mapping.items()},
-            "readiness": {self._normalize_key(k): v for k, v in self.config.readiness_mapping.items()},
-            "effort": {self._normalize_key(k): v for k, v in self.config.effort_mapping.items()},
-            "milestone": {self._normalize_key(k): v for k, v in self.config.milestone_mapping.items()},
-            "label": {self._normalize_key(k): v for k, v in self.config.label_mapping.items()},
-            "user": {self._normalize_key(k): v for k, v in self.config.user_mapping.items()},
-            "issue_type": {self._normalize_key(k): v for k, v in self.config.issue_type_mapping.items()},
-        }
+        self._iteration_map = self._int_keyed(self.config.iteration_mapping)
+        self._quarter_map = self._int_keyed(self.config.quarter_mapping)
+        self._status_map = self._normalized(self.config.status_mapping)
+        self._team_map = self._normalized(self.config.team_mapping)
+        self._priority_map = self._normalized(self.config.priority_mapping)
+        self._readiness_map = self._normalized(self.config.readiness_mapping)
+        self._effort_map = self._normalized(self.config.effort_mapping)
+        self._milestone_map = self._normalized(self.config.milestone_mapping)
+        self._label_map = self._normalized(self.config.label_mapping)
+        self._user_map = self._normalized(self.config.user_mapping)
+        self._issue_type_map = self._normalized(self.config.issue_type_mapping)
+    
+    def _normalized(self, mapping: Dict[str, str]) -> Dict[str, str]:
+        """Return a copy of mapping with normalized keys."""
+        return {self._normalize_key(k): v for k, v in mapping.items()}
     
-    def _normalize_key(self, key: str) -> str:
+    def _int_keyed(self, mapping: Dict[Any, str]) -> Dict[int, str]:
+        """Return a copy of mapping with integer keys (JSON object keys are strings)."""
+        result = {}
+        for k, v in mapping.items():
+            try:
+                result[int(k)] = v
+            except (TypeError, ValueError):
+                logger.warning(f"Ignoring non-numeric mapping key: {k!r}")
+        return result
+    
+    @staticmethod
+    def _normalize_key(key: Any) -> str:
         """Normalize a key for matching."""
-        key = str(key).strip().lower()
-        key = key.replace("–", "-").replace("—", "-")
-        key = re.sub(r"\s+", " ", key)
-        return key
-    
-    def _normalize_value(self, value: Any) -> str:
-        """Normalize a value for matching."""
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            return ""
-        return str(value).strip()
+        return _normalize_text(str(key))
     
     def map_iteration(self, value: Any) -> str:
         """Map iteration number or name to iteration ID."""
-        if value is None or (isinstance(value, float) and pd.isna(value)):
+        if self._is_missing(value):
             return ""
         
         # Try to extract number
         if isinstance(value, (int, float)):
             num = int(value)
-            return self.config.iteration_mapping.get(num, "")
+            return self._iteration_get(num, "")
         
         # Try to parse from string
         s = str(value).strip()
-        match = re.match(r"(?i)^\s*iteration\s*(\d+)\s*$", s)
+        match = _ITERATION_RE.match(s)
         if match:
             num = int(match.group(1))
-            return self.config.iteration_mapping.get(num, "")
+            return self._iteration_get(num, "")
         
-        match = re.match(r"^\s*(\d+)\s*$", s)
+        match = _NUMBER_RE.match(s)
         if match:
             num = int(match.group(1))
-            return self.config.iteration_mapping.get(num, "")
+            return self._iteration_get(num, "")
         
         return ""
     
     def map_quarter(self, value: Any) -> str:
         """Map quarter number or name to quarter iteration ID."""
-        if value is None or (isinstance(value, float) and pd.isna(value)):
+        if self._is_missing(value):
             return ""
         
         # Try to extract number
         if isinstance(value, (int, float)):
             num = int(value)
-            return self.config.quarter_mapping.get(num, "")
+            return self._quarter_get(num, "")
         
         # Try to parse from string
         s = str(value).strip()
-        match = re.match(r"(?i)^\s*quarter\s*(\d+)\s*$", s)
+        match = _QUARTER_RE.match(s)
         if match:
             num = int(match.group(1))
-            return self.config.quarter_mapping.get(num, "")
+            return self._quarter_get(num, "")
         
-        match = re.match(r"^\s*(\d+)\s*$", s)
+        match = _NUMBER_RE.match(s)
         if match:
             num = int(match.group(1))
-            return self.config.quarter_mapping.get(num, "")
+            return self._quarter_get(num, "")
         
         return ""
     
+    def _map_option(self, lookup: Callable[..., Optional[str]], value: Any) -> str:
+        """Map single-select option text to its option ID using a bound lookup."""
+        s = self._to_stripped_str(value)
+        if self._is_hex8_id(s):
+            return s
+        
+        return lookup(self._normalize_key(value), "")
+    
     def map_status(self, value: Any) -> str:
         """Map status text to status option ID."""
-        if self._is_hex8_id(value):
-            return str(value).strip()
-        
-        normalized = self._normalize_key(value)
-        return self._normalized_mappings["status"].get(normalized, "")
+        return self._map_option(self._status_get, value)
     
     def map_team(self, value: Any) -> str:
         """Map team text to team option ID."""
-        if self._is_hex8_id(value):
-            return str(value).strip()
-        
-        normalized = self._normalize_key(value)
-        return self._normalized_mappings["team"].get(normalized, "")
+        return self._map_option(self._team_get, value)
     
     def map_priority(self, value: Any) -> str:
         """Map priority text to priority option ID."""
-        if self._is_hex8_id(value):
-            return str(value).strip()
-        
-        normalized = self._normalize_key(value)
-        return self._normalized_mappings["priority"].get(normalized, "")
+        return self._map_option(self._priority_get, value)
     
     def map_readiness(self, value: Any) -> str:
         """Map readiness text to readiness option ID."""
-        if self._is_hex8_id(value):
-            return str(value).strip()
-        
-        normalized = self._normalize_key(value)
-        return self._normalized_mappings["readiness"].get(normalized, "")
+        return self._map_option(self._readiness_get, value)
     
     def map_effort(self, value: Any) -> str:
         """Map effort text to effort option ID."""
-        if self._is_hex8_id(value):
-            return str(value).strip()
-        
-        normalized = self._normalize_key(value)
-        return self._normalized_mappings["effort"].get(normalized, "")
+        return self._map_option(self._effort_get, value)
     
     def map_milestone(self, value: Any) -> str:
         """Map milestone text to milestone ID."""
-        if self._is_milestone_id(value):
-            return str(value).strip()
+        s = self._to_stripped_str(value)
+        if self._is_milestone_id(s):
+            return s
         
-        normalized = self._normalize_key(value)
-        return self._normalized_mappings["milestone"].get(normalized, "")
+        return self._milestone_get(self._normalize_key(value), "")
     
     def map_labels(self, value: Any, separator: str = "||") -> str:
         """Map label names to label IDs."""
-        if value is None or (isinstance(value, float) and pd.isna(value)):
+        if self._is_missing(value):
             return ""
         
         labels = [l.strip() for l in str(value).split(separator) if l.strip()]
         mapped = []
         
         for label in labels:
-            normalized = self._normalize_key(label)
-            label_id = self._normalized_mappings["label"].get(normalized, label)
-            mapped.append(label_id)
+            mapped.append(self._label_get(self._normalize_key(label), label))
         
         return separator.join(mapped) if mapped else ""
     
     def map_users(self, value: Any, separator: str = "||") -> str:
         """Map user names/handles to user IDs."""
-        if value is None or (isinstance(value, float) and pd.isna(value)):
+        if self._is_missing(value):
             return ""
         
         users = [u.strip() for u in str(value).split(separator) if u.strip()]
         mapped = []
         
         for user in users:
-            # If already a user ID, keep it
-            if self._is_user_id(user):
-                mapped.append(user)
-                continue
-            
-            # Try to map
-            cleaned = self._clean_user_token(user)
-            if not cleaned:
-                continue
-            
-            normalized = self._normalize_key(cleaned)
-            user_id = (
-                self._normalized_mappings["user"].get(normalized) or
-                self._normalized_mappings["user"].get(normalized.replace(" ", "")) or
-                self._normalized_mappings["user"].get("@" + normalized)
-            )
-            
+            user_id = self._map_user_token(user)
             if user_id:
                 mapped.append(user_id)
         
         return separator.join(mapped) if mapped else ""
     
+    def _map_user_token(self, user: str) -> Optional[str]:
+        """Map a single stripped user token to a user ID."""
+        # If already a user ID, keep it
+        if self._is_user_id(user):
+            return user
+        
+        # Try to map
+        cleaned = self._clean_user_token(user)
+        if not cleaned:
+            return None
+        
+        normalized = self._normalize_key(cleaned)
+        return (
+            self._user_get(normalized) or
+            self._user_get(normalized.replace(" ", "")) or
+            self._user_get("@" + normalized)
+        )
+    
+    @staticmethod
+    def map_series(values: "pd.Series", mapper: Callable[[Any], Any]) -> "pd.Series":
+        """
+        Apply a scalar mapper to a column, calling it once per distinct value.
+        
+        Mapping columns hold few distinct values (statuses, teams, sprints),
+        so this is much cheaper than Series.apply on large sheets. Values are
+        told apart by type as well, so 1, 1.0 and True are mapped separately;
+        missing cells are passed through without calling the mapper.
+        
+        Args:
+            values: Column to map
+            mapper: Scalar mapping function (e.g. map_status)
+        
+        Returns:
+            Mapped column with the same index
+        """
+        import numpy as np
+        import pandas as pd
+        
+        cells = values.to_numpy(dtype=object)
+        present = ~values.isna().to_numpy()
+        # factorize alone would treat 1, 1.0 and True as one value
+        keys = pd.Series([(type(value), value) for value in cells[present]], dtype=object)
+        codes, uniques = pd.factorize(keys)
+        lookup = np.empty(len(uniques), dtype=object)
+        lookup[:] = [mapper(value) for _, value in uniques]
+        mapped = cells.copy()
+        mapped[present] = lookup[codes]
+        return pd.Series(mapped, index=values.index, name=values.name)
+    
+    def map_labels_series(self, values: "pd.Series", separator: str = "||") -> "pd.Series":
+        """Vectorized map_labels over a whole column."""
+        tokens = self._explode_tokens(values, separator)
+        mapped = tokens.map({t: self._label_get(self._normalize_key(t), t) for t in tokens.unique()})
+        return self._join_tokens(mapped, values, separator)
+    
+    def map_users_series(self, values: "pd.Series", separator: str = "||") -> "pd.Series":
+        """Vectorized map_users over a whole column."""
+        tokens = self._explode_tokens(values, separator)
+        mapped = tokens.map({t: self._map_user_token(t) for t in tokens.unique()}).dropna()
+        return self._join_tokens(mapped[mapped.astype(bool)], values, separator)
+    
+    def map_issue_type_series(
+        self,
+        values: "pd.Series",
+        labels: "pd.Series",
+        separator: str = "||"
+    ) -> "pd.Series":
+        """
+        Vectorized map_issue_type over a column, with each row's labels.
+        
+        Rows with a label that implies an issue type get that type (the first
+        such label wins); the rest map their value, blank cells taking the
+        default type.
+        
+        Args:
+            values: Issue type column
+            labels: Labels column (multi-value, same index as values)
+            separator: Labels separator
+        
+        Returns:
+            Issue type IDs with the same index as values
+        """
+        mapped = self.map_series(values, self.map_issue_type)
+        mapped[values.isna().to_numpy()] = self.map_issue_type(None)
+        if self._label_issue_types:
+            # Exact label matches, not substrings ("debug" is not "bug")
+            tokens = self._explode_tokens(labels, separator)
+            implied = tokens.str.lower().map(self._label_issue_types).dropna()
+            first = implied.groupby(level=0).first()
+            mapped.iloc[first.index.to_numpy()] = first.to_numpy()
+        return mapped
+    
+    def format_date_series(self, values: "pd.Series") -> "pd.Series":
+        """Vectorized format_date over a whole column."""
+        import pandas as pd
+        
+        if pd.api.types.is_datetime64_any_dtype(values):
+            formatted = values.dt.strftime("%Y-%m-%d").astype(object)
+            formatted[values.isna()] = None
+            return formatted
+        return values.map(self.format_date).astype(object)
+    
+    @staticmethod
+    def _explode_tokens(values: "pd.Series", separator: str) -> "pd.Series":
+        """Split a multi-value column into stripped, non-empty tokens keyed by row position."""
+        text = values.reset_index(drop=True).astype(object)
+        text = text.where(text.notna(), "").astype(str)
+        tokens = text.str.split(separator, regex=False).explode().str.strip()
+        return tokens[tokens.astype(bool)]
+    
+    @staticmethod
+    def _join_tokens(tokens: "pd.Series", values: "pd.Series", separator: str) -> "pd.Series":
+        """Join exploded tokens back into one string per row of values."""
+        joined = tokens.groupby(level=0).agg(separator.join)
+        joined = joined.reindex(range(len(values)), fill_value="")
+        joined.index = values.index
+        return joined
+    
     def map_issue_type(self, value: Any, labels: Optional[str] = None) -> str:
         """Map issue type text or derive from labels."""
         # If labels provided and contain "bug", use bug type
-        if labels:
-            label_list = [l.lower() for l in str(labels).split("||") if l.strip()]
-            if "bug" in label_list:
-                bug_id = self._normalized_mappings["issue_type"].get("bug", "")
-                if bug_id:
-                    return bug_id
+        if labels and self._label_issue_types:
+            for label in str(labels).split("||"):
+                type_id = self._label_issue_types.get(label.strip().lower())
+                if type_id:
+                    return type_id
         
         # Try to map the value directly
         if value:
             normalized = self._normalize_key(value)
-            return self._normalized_mappings["issue_type"].get(normalized, "")
+            return self._issue_type_get(normalized, "")
         
         # Default type
-        return self._normalized_mappings["issue_type"].get("default", "")
+        return self._issue_type_get("default", "")
+    
+    @staticmethod
+    def _is_missing(value: Any) -> bool:
+        """Check if value is None or NaN (NaN is the only float unequal to itself)."""
+        return value is None or (isinstance(value, float) and value != value)
+    
+    def _to_stripped_str(self, value: Any) -> str:
+        """Convert a value to a stripped string ("" for missing values)."""
+        if self._is_missing(value):
+            return ""
+        return str(value).strip()
     
     def _is_hex8_id(self, value: Any) -> bool:
         """Check if value is an 8-character hex ID."""
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            return False
-        s = str(value).strip()
-        return bool(re.fullmatch(r"[0-9a-fA-F]{8}", s))
+        s = self._to_stripped_str(value)
+        return len(s) == 8 and all(c in _HEX_DIGITS for c in s)
     
     def _is_milestone_id(self, value: Any) -> bool:
         """Check if value is a milestone ID."""
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            return False
-        return str(value).strip().upper().startswith("MI_")
+        return self._to_stripped_str(value).upper().startswith("MI_")
     
     def _is_user_id(self, value: Any) -> bool:
         """Check if value is a user ID."""
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            return False
-        return str(value).strip().startswith("U_")
+        return self._to_stripped_str(value).startswith("U_")
     
     def _clean_user_token(self, token: str) -> str:
         """Clean a user token (name, handle, URL, etc.) for matching."""
         s = str(token).strip()
+        if not s:
+            return s
+        
+        # Fast path: plain names and handles need no URL, paren or prefix stripping
+        if (
+            "/" not in s and "(" not in s and "@" not in s
+            and s[0] not in _USER_TOKEN_SEPARATORS and s[-1] not in _USER_TOKEN_SEPARATORS
+        ):
+            return " ".join(s.split()).lower()
         
         # Extract from GitHub URL
-        match = re.search(r"github\.com/([^/\s]+)", s, flags=re.I)
+        match = _GITHUB_URL_RE.search(s)
         if match:
             s = match.group(1)
         
         # Remove parentheses content
-        s = re.sub(r"\(.*?\)", "", s)
+        s = _PARENS_RE.sub("", s)
         
         # Remove @ prefix
         s = s.lstrip("@")
         
         # Remove common separators
-        s = s.strip(" ,;:|/-")
+        s = s.strip(_USER_TOKEN_SEPARATORS)
         
         # Normalize whitespace
-        s = re.sub(r"\s+", " ", s).strip().lower()
+        s = _WHITESPACE_RE.sub(" ", s).strip().lower()
         
         return s
     
     def format_date(self, value: Any) -> Optional[str]:
         """Format date value to YYYY-MM-DD format."""
-        if value is None or (isinstance(value, float) and pd.isna(value)):
+        if self._is_missing(value):
             return None
         
+        # Fast paths: date objects and ISO-formatted strings skip pandas
+        if isinstance(value, datetime):
+            return None if value != value else value.date().isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
+        if isinstance(value, str):
+            s = value.strip()
+            # Only a bare YYYY-MM-DD; timestamps and trailing text go through pandas
+            if _ISO_DATE_RE.fullmatch(s):
+                try:
+                    return date.fromisoformat(s).isoformat()
+                except ValueError:
+                    pass
+        
         try:
+            import pandas as pd
             dt = pd.to_datetime(value)
             return dt.date().isoformat()
         except Exception:
@@ -16,26 +16,159 @@ The GitHubClient class abstracts away the complexity of API interactions,
 providing a clean interface for other modules to interact with GitHub.
 """
 
-import json
+import re
 import time
 import random
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from operator import getitem, itemgetter
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, List, Tuple
 import requests
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3.util.retry import Retry
 
+from . import json_utils
 from .config import GitHubConfig
 
 logger = logging.getLogger(__name__)
 
+# Requests left in a rate-limit window at which callers wait for the reset
+RATE_LIMIT_RESERVE = 5
+# Longest exponential backoff between throttled retries, in seconds
+MAX_BACKOFF = 60.0
+# Most REST GET responses kept for ETag revalidation (least recently used go first)
+GET_CACHE_SIZE = 128
+# Cached GET: (ETag, status code, headers, body)
+_CachedGet = Tuple[str, int, Dict[str, str], bytes]
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Server errors retried for idempotent requests and GraphQL queries
+_SERVER_ERRORS = frozenset([500, 502, 503, 504])
+_IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"])
+_MUTATION_RE = re.compile(r"^\s*mutation\b")
+_VARIABLE_RE = re.compile(r"\$(\w+)")
+
+
+def _path_getter(path: List[str]) -> Callable[[Dict[str, Any]], Any]:
+    """Build a function that walks a fixed key path into a response dict."""
+    if len(path) == 1:
+        return itemgetter(path[0])
+    return lambda data: reduce(getitem, path, data)
+
+
+def format_graphql_errors(errors: List[Dict[str, Any]]) -> str:
+    """Join GraphQL error messages into one string."""
+    return "; ".join(e.get("message", str(e)) for e in errors)
+
+
+def alias_failures(
+    data: Dict[str, Any],
+    errors: List[Dict[str, Any]],
+    aliases: Iterable[str]
+) -> Dict[str, List[str]]:
+    """
+    Work out which fields of an aliased document failed.
+    
+    A field failed if an error's path starts with its alias, if an error has
+    no path (it cannot be attributed, so it counts against every field), or
+    if it returned no data.
+    
+    Args:
+        data: Response data from graphql_with_errors
+        errors: GraphQL errors from graphql_with_errors
+        aliases: Aliases of the fields to check
+    
+    Returns:
+        Dictionary mapping each failed alias to its error messages (empty
+        when the field just returned no data), in the order of aliases
+    """
+    by_alias: Dict[str, List[str]] = {}
+    unattributed: List[str] = []
+    for error in errors:
+        path = error.get("path") or []
+        message = format_graphql_errors([error])
+        if path:
+            by_alias.setdefault(path[0], []).append(message)
+        else:
+            unattributed.append(message)
+    
+    failures = {}
+    for alias in aliases:
+        messages = by_alias.get(alias, []) + unattributed
+        if messages or data.get(alias) is None:
+            failures[alias] = messages
+    return failures
+
+
+def build_aliased_document(
+    operation: str,
+    fields: List[Tuple[str, str, Dict[str, str]]]
+) -> str:
+    """
+    Combine several GraphQL fields into one document under distinct aliases.
+    
+    Each field is written with plain variable names (e.g. "$issueId"); they
+    are renamed to "$<alias>_<name>" so fields cannot collide. Pass matching
+    variables built with alias_variables().
+    
+    Args:
+        operation: "mutation" or "query"
+        fields: (alias, field, variable types) tuples, e.g.
+            ("c0", "addComment(input: {subjectId: $issueId, body: $body}) { clientMutationId }",
+             {"issueId": "ID!", "body": "String!"})
+    
+    Returns:
+        GraphQL document string
+    """
+    declarations = []
+    selections = []
+    for alias, field, var_types in fields:
+        declarations.extend(f"${alias}_{name}: {type_}" for name, type_ in var_types.items())
+        field = _VARIABLE_RE.sub(
+            lambda m: f"${alias}_{m.group(1)}" if m.group(1) in var_types else m.group(0),
+            field
+        )
+        selections.append(f"  {alias}: {field}")
+    
+    header = f"{operation} ({', '.join(declarations)})" if declarations else operation
+    return header + " {\n" + "\n".join(selections) + "\n}"
+
+
+def alias_variables(alias: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """Prefix variable names to match a field built by build_aliased_document."""
+    return {f"{alias}_{name}": value for name, value in variables.items()}
+
 
 class GitHubClient:
     """Unified client for GitHub GraphQL and REST APIs."""
     
-    def __init__(self, config: GitHubConfig):
+    def __init__(
+        self,
+        config: GitHubConfig,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Create a client.
+        
+        Args:
+            config: GitHub API configuration
+            session: Optional pre-configured session to share between clients.
+                A shared session is left open by close(); its owner closes it.
+        """
         self.config = config
-        self.session = self._create_session()
+        self._owns_session = session is None
+        self.session = session if session is not None else self._create_session()
+        # Rate limit budget per resource ("core", "graphql"): (remaining, reset epoch)
+        self._rate_lock = threading.Lock()
+        self._rate_limits: Dict[str, Tuple[int, float]] = {}
+        # (endpoint, params) -> (ETag, status code, headers, body) for conditional
+        # REST GETs; only the body is kept, not the response and its connection
+        self._get_cache: "OrderedDict[Tuple[str, Tuple[Tuple[str, str], ...]], _CachedGet]" = OrderedDict()
+        self._get_cache_lock = threading.Lock()
     
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry logic."""
@@ -46,15 +179,23 @@ class GitHubClient:
             connect=self.config.max_retries,
             read=self.config.max_retries,
             backoff_factor=self.config.retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=frozenset(["GET", "POST", "PATCH", "DELETE"]),
+            # 403/429 rate limiting is handled by _request
+            status_forcelist=_SERVER_ERRORS,
+            # Read and status retries only for idempotent methods: a POST that
+            # timed out or got a 502 may already have run (e.g. a batch of
+            # createIssue mutations), so resending it could duplicate issues.
+            # Connection errors are still retried for every method
+            allowed_methods=_IDEMPOTENT_METHODS,
             raise_on_status=False,
         )
         
+        # Everything goes to one host, so the per-host pool size is what bounds
+        # concurrent requests; urllib3 already sets TCP_NODELAY and keeps
+        # connections alive
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
             pool_connections=10,
-            pool_maxsize=10
+            pool_maxsize=self.config.pool_maxsize
         )
         
         session.mount("https://", adapter)
@@ -68,6 +209,98 @@ class GitHubClient:
         
         return session
     
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, pacing on GitHub's rate limits and retrying when throttled.
+        
+        Requests wait for the reset time once the remaining budget reported by
+        X-RateLimit-* headers runs low. 403/429 rate-limit responses are retried
+        after Retry-After, the reset time, or exponential backoff with jitter.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            **kwargs: Passed through to requests.Session.request
+        
+        Returns:
+            Response object (the last one if retries are exhausted)
+        """
+        resource = "graphql" if url == self.config.api_url else "core"
+        
+        for attempt in range(self.config.max_retries + 1):
+            self._wait_for_budget(resource)
+            response = self.session.request(method, url, **kwargs)
+            self._record_rate_limit(response, resource)
+            
+            delay = self._throttle_delay(response, resource, attempt)
+            if delay is None or attempt == self.config.max_retries:
+                return response
+            
+            logger.warning(f"Rate limited ({response.status_code}) on {method} {url}; retrying in {delay:.1f}s")
+            response.close()
+            time.sleep(delay)
+        
+        return response
+    
+    def _wait_for_budget(self, resource: str):
+        """Block until the rate limit resets if the remaining budget is nearly spent."""
+        with self._rate_lock:
+            remaining, reset = self._rate_limits.get(resource, (None, 0.0))
+            if remaining is not None:
+                # Count in-flight requests so concurrent workers share the budget
+                self._rate_limits[resource] = (remaining - 1, reset)
+        
+        delay = reset - time.time()
+        if remaining is not None and remaining <= RATE_LIMIT_RESERVE and delay > 0:
+            logger.warning(f"Rate limit nearly exhausted ({remaining} left); waiting {delay:.0f}s for reset")
+            time.sleep(delay + 1)
+    
+    def _record_rate_limit(self, response: requests.Response, resource: str):
+        """Update the tracked budget from X-RateLimit-* response headers."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            budget = (int(remaining), float(reset))
+        except ValueError:
+            return
+        with self._rate_lock:
+            self._rate_limits[response.headers.get("X-RateLimit-Resource", resource)] = budget
+    
+    def _throttle_delay(self, response: requests.Response, resource: str, attempt: int) -> Optional[float]:
+        """Return how long to wait before retrying a rate-limited response, or None."""
+        if response.status_code not in (403, 429):
+            return None
+        
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            return self._reset_delay(response.headers.get("X-RateLimit-Resource", resource), attempt)
+        
+        # A 403 without rate-limit signals is a permission error, not throttling
+        if response.status_code == 403 and "rate limit" not in response.text.lower():
+            return None
+        
+        return self._backoff(attempt)
+    
+    def _reset_delay(self, resource: str, attempt: int) -> float:
+        """Seconds until the resource's rate limit resets (backoff if unknown)."""
+        with self._rate_lock:
+            _, reset = self._rate_limits.get(resource, (None, 0.0))
+        delay = reset - time.time()
+        return delay + 1 if delay > 0 else self._backoff(attempt)
+    
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter, capped at MAX_BACKOFF seconds."""
+        delay = min(self.config.retry_delay * (2 ** attempt), MAX_BACKOFF)
+        return delay + random.uniform(0, self.config.retry_delay)
+    
     def graphql(
         self,
         query: str,
@@ -90,64 +323,194 @@ class GitHubClient:
         Raises:
             RuntimeError: If the request fails or contains errors
         """
-        headers = dict(self.session.headers)
+        data, errors = self.graphql_with_errors(query, variables, features, timeout)
+        if errors:
+            raise RuntimeError(f"GraphQL errors: {format_graphql_errors(errors)}")
+        return data
+    
+    def graphql_with_errors(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        features: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Execute a GraphQL query/mutation, returning partial data with errors.
+        
+        Use this for documents with several aliased fields, where some fields
+        can fail while others succeed; each error's "path" starts with the
+        alias of the field that failed.
+        
+        Args:
+            query: GraphQL query/mutation string
+            variables: Variables for the query
+            features: Optional GraphQL features (e.g., ["sub_issues"])
+            timeout: Request timeout in seconds
+        
+        Returns:
+            Tuple of (response data dictionary, list of GraphQL errors)
+        
+        Raises:
+            RuntimeError: If the request fails or returns no data at all
+        """
+        # Session headers are merged in by requests; only send the extras
+        headers = _JSON_HEADERS
         if features:
-            headers["GraphQL-Features"] = ", ".join(features)
+            headers = {**_JSON_HEADERS, "GraphQL-Features": ", ".join(features)}
         
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
         
         timeout = timeout or self.config.timeout
+        body = json_utils.dumps(payload)
+        # Queries are safe to resend after a server error; mutations are not
+        is_query = not _MUTATION_RE.match(query)
         
-        try:
-            response = self.session.post(
-                self.config.api_url,
-                json=payload,
-                headers=headers,
-                timeout=timeout
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                response = self._request(
+                    "POST",
+                    self.config.api_url,
+                    data=body,
+                    headers=headers,
+                    timeout=timeout
+                )
+                if is_query and response.status_code in _SERVER_ERRORS and attempt < self.config.max_retries:
+                    delay = self._backoff(attempt)
+                    logger.warning(f"GraphQL query got {response.status_code}; retrying in {delay:.1f}s")
+                    response.close()
+                    time.sleep(delay)
+                    continue
+                response.raise_for_status()
+                
+                data = json_utils.loads(response.content)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.error(f"GraphQL request failed: {e}")
+                raise RuntimeError(f"GraphQL request failed: {e}")
             
-            if "errors" in data:
-                error_messages = [e.get("message", str(e)) for e in data["errors"]]
-                raise RuntimeError(f"GraphQL errors: {'; '.join(error_messages)}")
+            errors = data.get("errors") or []
             
-            if "data" not in data:
-                raise RuntimeError(f"No data in response: {data.get('message', 'Unknown error')}")
-            
-            return data["data"]
+            # The primary GraphQL limit is reported as a RATE_LIMITED error
+            if attempt < self.config.max_retries and any(e.get("type") == "RATE_LIMITED" for e in errors):
+                delay = self._reset_delay("graphql", attempt)
+                logger.warning(f"GraphQL rate limit exceeded; retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            break
+        
+        if data.get("data") is None:
+            if errors:
+                raise RuntimeError(f"GraphQL errors: {format_graphql_errors(errors)}")
+            raise RuntimeError(f"No data in response: {data.get('message', 'Unknown error')}")
         
-        except requests.exceptions.RequestException as e:
-            logger.error(f"GraphQL request failed: {e}")
-            raise RuntimeError(f"GraphQL request failed: {e}")
+        return data["data"], errors
     
     def rest_get(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        stream: bool = False
     ) -> requests.Response:
         """
         Execute a REST GET request.
         
+        Non-streamed responses that carry an ETag are cached (up to
+        GET_CACHE_SIZE of them); repeating the same request sends
+        If-None-Match and rebuilds the cached response when GitHub answers
+        304 Not Modified.
+        
         Args:
             endpoint: API endpoint (e.g., "/repos/owner/repo/issues")
             params: Query parameters
             timeout: Request timeout in seconds
+            stream: Return without reading the body (see iter_json_array)
         
         Returns:
             Response object
         """
         url = f"{self.config.rest_url}{endpoint}"
         timeout = timeout or self.config.timeout
+        params = params or {}
         
-        response = self.session.get(url, params=params or {}, timeout=timeout)
-        response.raise_for_status()
+        cache_key = None
+        headers = None
+        if not stream:
+            cache_key = (endpoint, tuple(sorted((str(k), str(v)) for k, v in params.items())))
+            with self._get_cache_lock:
+                cached = self._get_cache.get(cache_key)
+                if cached:
+                    self._get_cache.move_to_end(cache_key)
+            if cached:
+                headers = {"If-None-Match": cached[0]}
+        
+        response = self._request("GET", url, params=params, headers=headers, timeout=timeout, stream=stream)
+        
+        if headers and response.status_code == 304:
+            logger.debug(f"Not modified, using cached response: {endpoint}")
+            response.close()
+            return self._cached_response(response.url, cached)
+        
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            response.close()
+            raise
+        
+        etag = response.headers.get("ETag")
+        if cache_key and etag:
+            with self._get_cache_lock:
+                self._get_cache[cache_key] = (etag, response.status_code, dict(response.headers), response.content)
+                self._get_cache.move_to_end(cache_key)
+                while len(self._get_cache) > GET_CACHE_SIZE:
+                    self._get_cache.popitem(last=False)
+        return response
+    
+    @staticmethod
+    def _cached_response(url: str, cached: _CachedGet) -> requests.Response:
+        """
+        Rebuild a response from a cached GET entry.
+        
+        Args:
+            url: Request URL
+            cached: (ETag, status code, headers, body) as stored by rest_get
+        
+        Returns:
+            Response object with the cached status, headers and body
+        """
+        _, status_code, headers, content = cached
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(headers)
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = content
         return response
     
+    @staticmethod
+    def iter_json_array(response: requests.Response) -> Iterator[Any]:
+        """
+        Iterate over the items of a JSON array response body.
+        
+        For responses fetched with stream=True, items are decoded as the body
+        arrives instead of buffering it first. The response is closed once
+        iteration ends.
+        
+        Args:
+            response: Response whose body is a JSON array
+        
+        Yields:
+            Decoded array items in order
+        """
+        with response:
+            if response.raw is None or response._content_consumed:
+                yield from json_utils.loads(response.content)
+                return
+            response.raw.decode_content = True
+            yield from json_utils.iter_items(response.raw)
+    
     def rest_post(
         self,
         endpoint: str,
@@ -171,9 +534,11 @@ class GitHubClient:
         timeout = timeout or self.config.timeout
         
         if json_data:
-            response = self.session.post(url, json=json_data, timeout=timeout)
+            response = self._request(
+                "POST", url, data=json_utils.dumps(json_data), headers=_JSON_HEADERS, timeout=timeout
+            )
         else:
-            response = self.session.post(url, data=data or {}, timeout=timeout)
+            response = self._request("POST", url, data=data or {}, timeout=timeout)
         
         response.raise_for_status()
         return response
@@ -198,7 +563,9 @@ class GitHubClient:
         url = f"{self.config.rest_url}{endpoint}"
         timeout = timeout or self.config.timeout
         
-        response = self.session.patch(url, json=json_data or {}, timeout=timeout)
+        response = self._request(
+            "PATCH", url, data=json_utils.dumps(json_data or {}), headers=_JSON_HEADERS, timeout=timeout
+        )
         response.raise_for_status()
         return response
     
@@ -220,7 +587,7 @@ class GitHubClient:
         url = f"{self.config.rest_url}{endpoint}"
         timeout = timeout or self.config.timeout
         
-        response = self.session.delete(url, timeout=timeout)
+        response = self._request("DELETE", url, timeout=timeout)
         response.raise_for_status()
         return response
     
@@ -245,44 +612,82 @@ class GitHubClient:
         Returns:
             List of all nodes from all pages
         """
+        return list(self.iter_paginate_graphql(
+            query,
+            variables,
+            page_info_path=page_info_path,
+            nodes_path=nodes_path,
+            max_pages=max_pages,
+            prefetch=False
+        ))
+    
+    def iter_paginate_graphql(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        page_info_path: List[str] = None,
+        nodes_path: List[str] = None,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily paginate through GraphQL results, one page at a time.
+        
+        Pages are cursor-linked, so they cannot be fetched in parallel. With
+        prefetch enabled, the request for the next page is issued in the
+        background as soon as its cursor is known, overlapping it with the
+        caller's processing of the current page. Stopping iteration early
+        fetches no further pages (beyond one prefetched page).
+        
+        Args:
+            query: GraphQL query with pagination support
+            variables: Initial variables
+            page_info_path: Path to pageInfo in response (e.g., ["node", "items", "pageInfo"])
+            nodes_path: Path to nodes in response (e.g., ["node", "items", "nodes"])
+            max_pages: Maximum number of pages to fetch
+            prefetch: Fetch the next page while the current one is consumed
+        
+        Yields:
+            Nodes from each page, in order
+        """
         if page_info_path is None:
             page_info_path = ["pageInfo"]
         if nodes_path is None:
             nodes_path = ["nodes"]
         
-        all_nodes = []
-        after = None
-        page_count = 0
         variables = variables or {}
+        get_nodes = _path_getter(nodes_path)
+        get_page_info = _path_getter(page_info_path)
         
-        while True:
-            if max_pages and page_count >= max_pages:
-                break
-            
-            variables["after"] = after
-            data = self.graphql(query, variables)
-            
-            # Navigate to nodes
-            nodes = data
-            for key in nodes_path:
-                nodes = nodes[key]
-            
-            all_nodes.extend(nodes)
-            
-            # Navigate to pageInfo
-            page_info = data
-            for key in page_info_path:
-                page_info = page_info[key]
-            
-            if not page_info.get("hasNextPage"):
-                break
-            
-            after = page_info.get("endCursor")
-            page_count += 1
+        def fetch(after: Optional[str]) -> Dict[str, Any]:
+            return self.graphql(query, {**variables, "after": after})
         
-        return all_nodes
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            data = fetch(None)
+            page_count = 1
+            
+            while True:
+                nodes = get_nodes(data)
+                page_info = get_page_info(data)
+                
+                has_next = page_info.get("hasNextPage") and not (max_pages and page_count >= max_pages)
+                after = page_info.get("endCursor")
+                pending = executor.submit(fetch, after) if has_next and executor else None
+                
+                yield from nodes
+                
+                if not has_next:
+                    break
+                
+                data = pending.result() if pending else fetch(after)
+                page_count += 1
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
     
     def close(self):
-        """Close the session."""
-        self.session.close()
+        """Close the session (unless it was provided by the caller)."""
+        if self._owns_session:
+            self.session.close()
 
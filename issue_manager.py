@@ -19,14 +19,165 @@ configured issues with all their metadata and relationships.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 
-from .github_client import GitHubClient
+from .github_client import GitHubClient, alias_failures, alias_variables, build_aliased_document
 from .config import ProjectConfig, ProcessingConfig
 
 logger = logging.getLogger(__name__)
 
+# GraphQL documents are module constants so they are built once at import time
+_ADD_TO_PROJECT_MUTATION = """
+mutation ($projectId: ID!, $issueId: ID!) {
+  addProjectV2ItemById(input: { projectId: $projectId, contentId: $issueId }) {
+    item { id }
+  }
+}
+"""
+
+_UPDATE_ISSUE_MUTATION = """
+mutation ($issueId: ID!, $input: UpdateIssueInput!) {
+  updateIssue(input: $input) {
+    issue { id number url }
+  }
+}
+"""
+
+_ADD_ASSIGNEES_MUTATION = """
+mutation ($issueId: ID!, $assigneeIds: [ID!]!) {
+  addAssigneesToAssignable(
+    input: { assignableId: $issueId, assigneeIds: $assigneeIds }
+  ) {
+    assignable { ... on Issue { id number url } }
+  }
+}
+"""
+
+_UPDATE_PROJECT_FIELD_MUTATION = """
+mutation ($projectId: ID!, $itemId: ID!, $fieldId: ID!, $value: ProjectV2FieldValue!) {
+  updateProjectV2ItemFieldValue(
+    input: { projectId: $projectId, itemId: $itemId, fieldId: $fieldId, value: $value }
+  ) {
+    projectV2Item { id }
+  }
+}
+"""
+
+_ADD_COMMENT_MUTATION = """
+mutation ($issueId: ID!, $body: String!) {
+  addComment(input: { subjectId: $issueId, body: $body }) {
+    commentEdge {
+      node {
+        id
+        url
+        body
+        createdAt
+        author { login }
+      }
+    }
+  }
+}
+"""
+
+_ADD_LABELS_MUTATION = """
+mutation ($issueId: ID!, $labelIds: [ID!]!) {
+  addLabelsToLabelable(
+    input: { labelableId: $issueId, labelIds: $labelIds }
+  ) {
+    labelable { ... on Issue { id number url } }
+  }
+}
+"""
+
+_DELETE_ISSUE_MUTATION = """
+mutation ($issueId: ID!) {
+  deleteIssue(input: { issueId: $issueId }) {
+    clientMutationId
+  }
+}
+"""
+
+# ProjectV2FieldValue input builders by project field type
+_VALUE_BUILDERS = {
+    "date": lambda value: {"date": value},
+    "iteration": lambda value: {"iterationId": str(value)},
+    "singleSelect": lambda value: {"singleSelectOptionId": str(value)},
+}
+
+# create_complete_issue arguments applied after the issue exists
+_POST_CREATE_KEYS = ("project_id", "project_fields", "comments")
+
+# Optional createIssue details; an issue is re-created without them when they
+# are rejected, and they are then set one by one
+_OPTIONAL_CREATE_KEYS = ("milestone_id", "issue_type_id", "assignee_ids", "label_ids")
+
+# Upper bound on createIssue mutations sent in one request
+MAX_CREATE_BATCH = 25
+
+_CREATE_ISSUE_FIELD = (
+    "createIssue(input: $input) { issue { id number url } }",
+    {"input": "CreateIssueInput!"}
+)
+
+
+def _create_issue_input(
+    repo_id: str,
+    title: str,
+    body: str = "",
+    milestone_id: Optional[str] = None,
+    issue_type_id: Optional[str] = None,
+    assignee_ids: Optional[List[str]] = None,
+    label_ids: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Build a CreateIssueInput, setting the optional details only when given."""
+    issue_input = {"repositoryId": repo_id, "title": title, "body": body or ""}
+    if milestone_id:
+        issue_input["milestoneId"] = milestone_id
+    if issue_type_id:
+        issue_input["issueTypeId"] = issue_type_id
+    if assignee_ids:
+        issue_input["assigneeIds"] = assignee_ids
+    if label_ids:
+        issue_input["labelIds"] = label_ids
+    return issue_input
+
+
+@lru_cache(maxsize=8)
+def _create_issues_document(count: int) -> str:
+    """Build (once per batch size) the aliased mutation creating `count` issues."""
+    return build_aliased_document("mutation", [(f"issue{i}", *_CREATE_ISSUE_FIELD) for i in range(count)])
+
+
+# Mutation fields combined into one aliased document once the issue exists
+_ADD_TO_PROJECT_FIELD = (
+    "addProjectV2ItemById(input: { projectId: $projectId, contentId: $issueId }) { item { id } }",
+    {"projectId": "ID!", "issueId": "ID!"}
+)
+_UPDATE_ISSUE_FIELD = (
+    "updateIssue(input: $input) { issue { id } }",
+    {"input": "UpdateIssueInput!"}
+)
+_ADD_ASSIGNEES_FIELD = (
+    "addAssigneesToAssignable(input: { assignableId: $issueId, assigneeIds: $assigneeIds }) "
+    "{ clientMutationId }",
+    {"issueId": "ID!", "assigneeIds": "[ID!]!"}
+)
+_ADD_LABELS_FIELD = (
+    "addLabelsToLabelable(input: { labelableId: $issueId, labelIds: $labelIds }) { clientMutationId }",
+    {"issueId": "ID!", "labelIds": "[ID!]!"}
+)
+_UPDATE_PROJECT_FIELD_FIELD = (
+    "updateProjectV2ItemFieldValue(input: { projectId: $projectId, itemId: $itemId, "
+    "fieldId: $fieldId, value: $value }) { projectV2Item { id } }",
+    {"projectId": "ID!", "itemId": "ID!", "fieldId": "ID!", "value": "ProjectV2FieldValue!"}
+)
+_ADD_COMMENT_FIELD = (
+    "addComment(input: { subjectId: $issueId, body: $body }) { clientMutationId }",
+    {"issueId": "ID!", "body": "String!"}
+)
+
 
 @dataclass
 class IssueResult:
@@ -60,7 +211,11 @@ class IssueManager:
         self,
         repo_id: str,
         title: str,
-        body: str = ""
+        body: str = "",
+        milestone_id: Optional[str] = None,
+        issue_type_id: Optional[str] = None,
+        assignee_ids: Optional[List[str]] = None,
+        label_ids: Optional[List[str]] = None
     ) -> IssueResult:
         """
         Create a new issue.
@@ -69,43 +224,23 @@ class IssueManager:
             repo_id: Repository node ID
             title: Issue title
             body: Issue body/description
+            milestone_id: Milestone node ID
+            issue_type_id: Issue type ID
+            assignee_ids: List of assignee user IDs
+            label_ids: List of label node IDs
         
         Returns:
             IssueResult with issue details
         """
-        if self.processing.dry_run:
-            logger.info(f"[DRY RUN] Would create issue: {title}")
-            return IssueResult(success=True, issue_id="DRY_RUN_ID")
-        
-        query = """
-        mutation ($repoId: ID!, $title: String!, $body: String!) {
-          createIssue(input: { repositoryId: $repoId, title: $title, body: $body }) {
-            issue {
-              id
-              number
-              url
-            }
-          }
-        }
-        """
-        
-        try:
-            data = self.client.graphql(query, {
-                "repoId": repo_id,
-                "title": title,
-                "body": body or ""
-            })
-            
-            issue = data["createIssue"]["issue"]
-            return IssueResult(
-                success=True,
-                issue_id=issue["id"],
-                issue_number=issue["number"],
-                issue_url=issue["url"]
-            )
-        except Exception as e:
-            logger.error(f"Failed to create issue: {e}")
-            return IssueResult(success=False, errors=[str(e)])
+        return self.create_issues_batch([{
+            "repo_id": repo_id,
+            "title": title,
+            "body": body,
+            "milestone_id": milestone_id,
+            "issue_type_id": issue_type_id,
+            "assignee_ids": assignee_ids,
+            "label_ids": label_ids
+        }], 1)[0]
     
     def add_to_project(
         self,
@@ -126,16 +261,8 @@ class IssueManager:
             logger.info(f"[DRY RUN] Would add issue {issue_id} to project {project_id}")
             return "DRY_RUN_ITEM_ID"
         
-        query = """
-        mutation ($projectId: ID!, $issueId: ID!) {
-          addProjectV2ItemById(input: { projectId: $projectId, contentId: $issueId }) {
-            item { id }
-          }
-        }
-        """
-        
         try:
-            data = self.client.graphql(query, {
+            data = self.client.graphql(_ADD_TO_PROJECT_MUTATION, {
                 "projectId": project_id,
                 "issueId": issue_id
             })
@@ -175,17 +302,10 @@ class IssueManager:
             updates["issueTypeId"] = issue_type_id
         
         if updates:
-            query = """
-            mutation ($issueId: ID!, $input: UpdateIssueInput!) {
-              updateIssue(input: $input) {
-                issue { id number url }
-              }
-            }
-            """
             
             try:
                 input_data = {"id": issue_id, **updates}
-                self.client.graphql(query, {
+                self.client.graphql(_UPDATE_ISSUE_MUTATION, {
                     "issueId": issue_id,
                     "input": input_data
                 })
@@ -194,18 +314,9 @@ class IssueManager:
                 return False
         
         if assignee_ids:
-            query = """
-            mutation ($issueId: ID!, $assigneeIds: [ID!]!) {
-              addAssigneesToAssignable(
-                input: { assignableId: $issueId, assigneeIds: $assigneeIds }
-              ) {
-                assignable { ... on Issue { id number url } }
-              }
-            }
-            """
             
             try:
-                self.client.graphql(query, {
+                self.client.graphql(_ADD_ASSIGNEES_MUTATION, {
                     "issueId": issue_id,
                     "assigneeIds": assignee_ids
                 })
@@ -240,40 +351,83 @@ class IssueManager:
             logger.info(f"[DRY RUN] Would update project field {field_id}")
             return True
         
-        # Build value input based on field type
-        value_input = {}
-        if field_type == "date":
-            value_input = {"date": value}
-        elif field_type == "iteration":
-            value_input = {"iterationId": str(value)}
-        elif field_type == "singleSelect":
-            value_input = {"singleSelectOptionId": str(value)}
-        else:
+        builder = _VALUE_BUILDERS.get(field_type)
+        if builder is None:
             logger.warning(f"Unknown field type: {field_type}")
             return False
         
-        query = """
-        mutation ($projectId: ID!, $itemId: ID!, $fieldId: ID!, $value: ProjectV2FieldValue!) {
-          updateProjectV2ItemFieldValue(
-            input: { projectId: $projectId, itemId: $itemId, fieldId: $fieldId, value: $value }
-          ) {
-            projectV2Item { id }
-          }
-        }
-        """
-        
         try:
-            self.client.graphql(query, {
+            self.client.graphql(_UPDATE_PROJECT_FIELD_MUTATION, {
                 "projectId": project_id,
                 "itemId": item_id,
                 "fieldId": field_id,
-                "value": value_input
+                "value": builder(value)
             })
             return True
         except Exception as e:
             logger.error(f"Failed to update project field: {e}")
             return False
     
+    def update_project_fields_bulk(
+        self,
+        project_id: str,
+        item_id: str,
+        fields: Dict[str, Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Update several project field values with one aliased mutation.
+        
+        Args:
+            project_id: Project node ID
+            item_id: Project item node ID
+            fields: Dict mapping field_id to {value, type} (type defaults to singleSelect)
+        
+        Returns:
+            Field IDs that could not be updated, in input order (empty if all succeeded)
+        """
+        if self.processing.dry_run:
+            logger.info(f"[DRY RUN] Would update {len(fields)} project fields on item {item_id}")
+            return []
+        
+        failed = []
+        aliased_fields = []
+        variables = {}
+        field_ids = {}
+        for i, (field_id, field_data) in enumerate(fields.items()):
+            field_type = field_data.get("type", "singleSelect")
+            builder = _VALUE_BUILDERS.get(field_type)
+            if builder is None:
+                logger.warning(f"Unknown field type: {field_type}")
+                failed.append(field_id)
+                continue
+            
+            alias = f"field{i}"
+            aliased_fields.append((alias, *_UPDATE_PROJECT_FIELD_FIELD))
+            variables.update(alias_variables(alias, {
+                "projectId": project_id,
+                "itemId": item_id,
+                "fieldId": field_id,
+                "value": builder(field_data["value"])
+            }))
+            field_ids[alias] = field_id
+        
+        if not aliased_fields:
+            return failed
+        
+        try:
+            data, gql_errors = self.client.graphql_with_errors(
+                build_aliased_document("mutation", aliased_fields),
+                variables
+            )
+        except Exception as e:
+            logger.error(f"Failed to update project fields: {e}")
+            return failed + list(field_ids.values())
+        
+        for alias, messages in alias_failures(data, gql_errors, field_ids).items():
+            logger.error(f"Failed to update project field {field_ids[alias]}: {'; '.join(messages) or 'no data returned'}")
+            failed.append(field_ids[alias])
+        return [field_id for field_id in fields if field_id in failed]
+    
     def add_comment(
         self,
         issue_id: str,
@@ -293,24 +447,8 @@ class IssueManager:
             logger.info(f"[DRY RUN] Would add comment to issue {issue_id}")
             return True
         
-        query = """
-        mutation ($issueId: ID!, $body: String!) {
-          addComment(input: { subjectId: $issueId, body: $body }) {
-            commentEdge {
-              node {
-                id
-                url
-                body
-                createdAt
-                author { login }
-              }
-            }
-          }
-        }
-        """
-        
         try:
-            self.client.graphql(query, {
+            self.client.graphql(_ADD_COMMENT_MUTATION, {
                 "issueId": issue_id,
                 "body": body
             })
@@ -338,18 +476,8 @@ class IssueManager:
             logger.info(f"[DRY RUN] Would add labels to issue {issue_id}")
             return True
         
-        query = """
-        mutation ($issueId: ID!, $labelIds: [ID!]!) {
-          addLabelsToLabelable(
-            input: { labelableId: $issueId, labelIds: $labelIds }
-          ) {
-            labelable { ... on Issue { id number url } }
-          }
-        }
-        """
-        
         try:
-            self.client.graphql(query, {
+            self.client.graphql(_ADD_LABELS_MUTATION, {
                 "issueId": issue_id,
                 "labelIds": label_ids
             })
@@ -375,16 +503,8 @@ class IssueManager:
             logger.info(f"[DRY RUN] Would delete issue {issue_id}")
             return True
         
-        query = """
-        mutation ($issueId: ID!) {
-          deleteIssue(input: { issueId: $issueId }) {
-            clientMutationId
-          }
-        }
-        """
-        
         try:
-            self.client.graphql(query, {"issueId": issue_id})
+            self.client.graphql(_DELETE_ISSUE_MUTATION, {"issueId": issue_id})
             return True
         except Exception as e:
             logger.error(f"Failed to delete issue: {e}")
@@ -421,60 +541,298 @@ class IssueManager:
         Returns:
             IssueResult with all details
         """
-        result = IssueResult(success=False)
-        
-        # Step 1: Create issue
-        create_result = self.create_issue(repo_id, title, body)
+        if self.processing.dry_run:
+            return self._dry_run_result(title)
+        
+        # Step 1: Create issue (with milestone, type, assignees and labels)
+        create_result = self.create_issue(
+            repo_id,
+            title,
+            body,
+            milestone_id=milestone_id,
+            issue_type_id=issue_type_id,
+            assignee_ids=assignee_ids,
+            label_ids=label_ids
+        )
         if not create_result.success:
-            result.errors.extend(create_result.errors)
-            return result
+            return IssueResult(success=False, errors=list(create_result.errors))
+        
+        return self._complete_created_issue(
+            create_result,
+            project_id,
+            project_fields=project_fields,
+            comments=comments
+        )
+    
+    def create_complete_issues(
+        self,
+        specs: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> List[IssueResult]:
+        """
+        Create several complete issues, batching the createIssue mutations.
+        
+        Args:
+            specs: Keyword arguments for create_complete_issue, one dict per issue
+            batch_size: Issues created per request (see create_issues_batch)
+        
+        Returns:
+            IssueResult for each spec, in the same order
+        """
+        if self.processing.dry_run:
+            return [self._dry_run_result(spec["title"]) for spec in specs]
+        
+        created = self.create_issues_batch(
+            [{k: v for k, v in spec.items() if k not in _POST_CREATE_KEYS} for spec in specs],
+            batch_size
+        )
+        
+        results = []
+        for spec, create_result in zip(specs, created):
+            if not create_result.success:
+                results.append(IssueResult(success=False, errors=list(create_result.errors)))
+                continue
+            results.append(self._complete_created_issue(
+                create_result,
+                spec["project_id"],
+                project_fields=spec.get("project_fields"),
+                comments=spec.get("comments")
+            ))
+        return results
+    
+    @staticmethod
+    def _dry_run_result(title: str) -> IssueResult:
+        """Return the result of a complete issue creation skipped by dry run."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"[DRY RUN] Would create complete issue: {title}")
+        return IssueResult(success=True, issue_id="DRY_RUN_ID", project_item_id="DRY_RUN_ITEM_ID")
+    
+    def create_issues_batch(
+        self,
+        specs: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> List[IssueResult]:
+        """
+        Create many issues with one aliased createIssue mutation per batch.
         
-        result.issue_id = create_result.issue_id
-        result.issue_number = create_result.issue_number
-        result.issue_url = create_result.issue_url
+        Args:
+            specs: Dicts with "repo_id", "title" and optional "body",
+                "milestone_id", "issue_type_id", "assignee_ids" and "label_ids"
+            batch_size: Issues per request (defaults to processing.batch_size,
+                capped at MAX_CREATE_BATCH)
         
-        # Step 2: Add to project
-        item_id = self.add_to_project(project_id, result.issue_id)
+        Returns:
+            IssueResult for each spec, in the same order. An issue whose
+            optional details are rejected (e.g. an unknown label ID) is
+            created again without them and the details are then set one by
+            one; its result is successful but lists any detail that was
+            rejected again in errors.
+        """
+        if self.processing.dry_run:
+            for spec in specs:
+                logger.info(f"[DRY RUN] Would create issue: {spec['title']}")
+            return [IssueResult(success=True, issue_id="DRY_RUN_ID") for _ in specs]
+        
+        batch_size = max(1, min(batch_size or self.processing.batch_size, MAX_CREATE_BATCH))
+        results = []
+        # (result position, spec without its optional details, errors of the first attempt)
+        retries: List[Tuple[int, Dict[str, Any], List[str]]] = []
+        
+        for start in range(0, len(specs), batch_size):
+            batch = specs[start:start + batch_size]
+            variables = {}
+            for i, spec in enumerate(batch):
+                variables.update(alias_variables(f"issue{i}", {"input": _create_issue_input(**spec)}))
+            
+            try:
+                data, errors = self.client.graphql_with_errors(
+                    _create_issues_document(len(batch)),
+                    variables
+                )
+            except Exception as e:
+                logger.error(f"Failed to create issues: {e}")
+                results.extend(IssueResult(success=False, errors=[str(e)]) for _ in batch)
+                continue
+            
+            failures = alias_failures(data, errors, (f"issue{i}" for i in range(len(batch))))
+            for i in range(len(batch)):
+                alias = f"issue{i}"
+                issue = (data.get(alias) or {}).get("issue")
+                if alias in failures or not issue:
+                    issue_errors = failures.get(alias) or ["No issue returned"]
+                    logger.error(f"Failed to create issue: {'; '.join(issue_errors)}")
+                    # A GraphQL error may come from one bad mapped ID; keep the issue
+                    spec = batch[i]
+                    if failures.get(alias) and any(spec.get(key) for key in _OPTIONAL_CREATE_KEYS):
+                        stripped = {k: v for k, v in spec.items() if k not in _OPTIONAL_CREATE_KEYS}
+                        retries.append((len(results), stripped, issue_errors))
+                    results.append(IssueResult(success=False, errors=issue_errors))
+                    continue
+                results.append(IssueResult(
+                    success=True,
+                    issue_id=issue["id"],
+                    issue_number=issue["number"],
+                    issue_url=issue["url"]
+                ))
+        
+        if retries:
+            retried = self.create_issues_batch([spec for _, spec, _ in retries], batch_size)
+            for (pos, _, first_errors), retry_result in zip(retries, retried):
+                if retry_result.success:
+                    retry_result.errors = self._set_rejected_details(retry_result.issue_id, specs[pos])
+                else:
+                    retry_result.errors = list(dict.fromkeys(first_errors + retry_result.errors))
+                results[pos] = retry_result
+        
+        return results
+    
+    def _set_rejected_details(self, issue_id: str, spec: Dict[str, Any]) -> List[str]:
+        """
+        Set the optional details of an issue that had to be created without them.
+        
+        Every milestone, issue type, assignee and label is its own aliased
+        field in one mutation, so only the IDs that are rejected again are lost.
+        
+        Args:
+            issue_id: Issue node ID
+            spec: create_issues_batch spec the issue was created from
+        
+        Returns:
+            Error messages for the details that could not be set
+        """
+        fields = []
+        variables = {}
+        details = {}
+        
+        def add(alias, field, field_vars, detail):
+            fields.append((alias, *field))
+            variables.update(alias_variables(alias, field_vars))
+            details[alias] = detail
+        
+        if spec.get("milestone_id"):
+            add("milestone", _UPDATE_ISSUE_FIELD, {"input": {"id": issue_id, "milestoneId": spec["milestone_id"]}},
+                f"milestone {spec['milestone_id']}")
+        if spec.get("issue_type_id"):
+            add("issueType", _UPDATE_ISSUE_FIELD, {"input": {"id": issue_id, "issueTypeId": spec["issue_type_id"]}},
+                f"issue type {spec['issue_type_id']}")
+        for i, assignee_id in enumerate(spec.get("assignee_ids") or []):
+            add(f"assignee{i}", _ADD_ASSIGNEES_FIELD, {"issueId": issue_id, "assigneeIds": [assignee_id]},
+                f"assignee {assignee_id}")
+        for i, label_id in enumerate(spec.get("label_ids") or []):
+            add(f"label{i}", _ADD_LABELS_FIELD, {"issueId": issue_id, "labelIds": [label_id]},
+                f"label {label_id}")
+        
+        try:
+            data, errors = self.client.graphql_with_errors(build_aliased_document("mutation", fields), variables)
+        except Exception as e:
+            logger.error(f"Failed to set issue details: {e}")
+            return [f"Failed to set {detail}: {e}" for detail in details.values()]
+        
+        rejected = []
+        for alias, messages in alias_failures(data, errors, details).items():
+            message = f"Failed to set {details[alias]}: {'; '.join(messages) or 'no data returned'}"
+            logger.warning(f"Issue {issue_id}: {message}")
+            rejected.append(message)
+        return rejected
+    
+    def _complete_created_issue(
+        self,
+        create_result: IssueResult,
+        project_id: str,
+        project_fields: Optional[Dict[str, Dict[str, Any]]] = None,
+        comments: Optional[List[str]] = None
+    ) -> IssueResult:
+        """Add a newly created issue to the project and set its field values and comments."""
+        result = IssueResult(
+            success=False,
+            issue_id=create_result.issue_id,
+            issue_number=create_result.issue_number,
+            issue_url=create_result.issue_url,
+            # e.g. details the issue had to be created without
+            errors=list(create_result.errors)
+        )
+        
+        # Step 2: Add to project and add comments in one request (mutation
+        # fields run in document order). When stopping on errors, comments
+        # wait until the issue is in the project.
+        stop_on_error = not self.processing.continue_on_error
+        item_id, errors = self._add_to_project_with_comments(
+            project_id, result.issue_id, None if stop_on_error else comments
+        )
+        result.errors.extend(errors)
         if not item_id:
-            result.errors.append("Failed to add issue to project")
-            if not self.processing.continue_on_error:
+            result.errors.insert(0, "Failed to add issue to project")
+            if stop_on_error:
                 return result
         else:
             result.project_item_id = item_id
         
-        # Step 3: Update issue fields
-        if milestone_id or issue_type_id or assignee_ids:
-            if not self.update_issue_fields(
-                result.issue_id,
-                milestone_id,
-                issue_type_id,
-                assignee_ids
-            ):
-                result.errors.append("Failed to update issue fields")
-        
-        # Step 4: Update project fields
+        if stop_on_error and comments:
+            _, errors = self._add_to_project_with_comments(None, result.issue_id, comments)
+            result.errors.extend(errors)
+        
+        # Step 3: Update project fields (one request for all of them)
         if project_fields and result.project_item_id:
-            for field_id, field_data in project_fields.items():
-                if not self.update_project_field(
-                    project_id,
-                    result.project_item_id,
-                    field_id,
-                    field_data["value"],
-                    field_data.get("type", "singleSelect")
-                ):
-                    result.errors.append(f"Failed to update project field {field_id}")
-        
-        # Step 5: Add labels
-        if label_ids:
-            if not self.add_labels(result.issue_id, label_ids):
-                result.errors.append("Failed to add labels")
-        
-        # Step 6: Add comments
-        if comments:
-            for comment in comments:
-                if not self.add_comment(result.issue_id, comment):
-                    result.errors.append(f"Failed to add comment")
+            for field_id in self.update_project_fields_bulk(project_id, result.project_item_id, project_fields):
+                result.errors.append(f"Failed to update project field {field_id}")
         
         result.success = len(result.errors) == 0 or self.processing.continue_on_error
         return result
-
+    
+    def _add_to_project_with_comments(
+        self,
+        project_id: Optional[str],
+        issue_id: str,
+        comments: Optional[List[str]] = None
+    ) -> Tuple[Optional[str], List[str]]:
+        """
+        Add a new issue to a project and add its comments in one aliased mutation.
+        
+        Args:
+            project_id: Project node ID, or None to only add the comments
+            issue_id: Issue node ID
+            comments: List of comment bodies
+        
+        Returns:
+            Tuple of (project item ID or None, error messages for failed
+            comments)
+        """
+        if self.processing.dry_run:
+            if project_id is None:
+                logger.info(f"[DRY RUN] Would add {len(comments or [])} comments to issue {issue_id}")
+                return None, []
+            logger.info(f"[DRY RUN] Would add issue {issue_id} to project {project_id} with its comments")
+            return "DRY_RUN_ITEM_ID", []
+        
+        fields = []
+        variables = {}
+        if project_id is not None:
+            fields.append(("project", *_ADD_TO_PROJECT_FIELD))
+            variables.update(alias_variables("project", {"projectId": project_id, "issueId": issue_id}))
+        failure_messages = {}
+        
+        for i, comment in enumerate(comments or []):
+            alias = f"comment{i}"
+            fields.append((alias, *_ADD_COMMENT_FIELD))
+            variables.update(alias_variables(alias, {"issueId": issue_id, "body": comment}))
+            failure_messages[alias] = f"Failed to add comment {i + 1}"
+        
+        try:
+            data, gql_errors = self.client.graphql_with_errors(
+                build_aliased_document("mutation", fields),
+                variables
+            )
+        except Exception as e:
+            logger.error(f"Failed to add issue to project with comments: {e}")
+            return None, list(failure_messages.values())
+        
+        failures = alias_failures(data, gql_errors, [alias for alias, *_ in fields])
+        # An error without a path is listed under every alias; log each error once
+        for message in dict.fromkeys(m for messages in failures.values() for m in messages):
+            logger.error(f"Failed to add issue to project with comments: {message}")
+        
+        item_id = None
+        if project_id is not None and "project" not in failures:
+            item_id = (data["project"].get("item") or {}).get("id")
+        errors = [message for alias, message in failure_messages.items() if alias in failures]
+        return item_id, errors
@@ -0,0 +1,108 @@
+"""
+JSON helpers - fast JSON encoding and decoding with a stdlib fallback.
+
+Author: Achal Samarthya
+
+This module centralizes JSON (de)serialization for the GitHub Migrator tool.
+It uses orjson when it is installed, which is several times faster than the
+standard library for both decoding and encoding, and falls back to the
+stdlib json module otherwise. It provides:
+- Decoding JSON from str or bytes
+- Encoding objects to UTF-8 JSON bytes (optionally indented)
+- Reading and writing JSON files
+- Streaming the items of a top-level JSON array (with ijson when installed)
+"""
+
+import json
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode a JSON document.
+    
+    Args:
+        data: JSON text or UTF-8 bytes
+    
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode an object as UTF-8 JSON bytes.
+    
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with a two-space indent
+    
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def load_file(path: Path) -> Any:
+    """
+    Read and decode a JSON file.
+    
+    Args:
+        path: Path to JSON file
+    
+    Returns:
+        Decoded Python object
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_file(obj: Any, path: Path, indent: bool = True):
+    """
+    Encode an object and write it to a JSON file.
+    
+    Args:
+        obj: Object to encode
+        path: Output file path
+        indent: Pretty-print with a two-space indent
+    """
+    with open(path, 'wb') as f:
+        f.write(dumps(obj, indent=indent))
+
+
+def iter_items(fp: BinaryIO) -> Iterator[Any]:
+    """
+    Iterate over the items of a top-level JSON array.
+    
+    Uses ijson to parse the stream incrementally when it is installed, so the
+    whole document is never held in memory; otherwise decodes it in one go.
+    
+    Args:
+        fp: Binary file-like object positioned at the start of the array
+    
+    Yields:
+        Decoded array items in order
+    """
+    if ijson is not None:
+        yield from ijson.items(fp, "item", use_float=True)
+    else:
+        yield from loads(fp.read())
@@ -16,14 +16,35 @@ or updating them if they do.
 """
 
 import logging
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
+from . import json_utils
 from .github_client import GitHubClient
 from .config import ProcessingConfig
 
 logger = logging.getLogger(__name__)
 
+# 100 labels per page is the GraphQL maximum
+_LABELS_QUERY = """
+query ($owner: String!, $name: String!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    labels(first: 100, after: $after) {
+      nodes { id name color description }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# Bounds on cached repository label listings (cachetools is not a dependency)
+LABEL_CACHE_SIZE = 256
+LABEL_CACHE_TTL = 600.0
+
 
 @dataclass
 class Label:
@@ -33,6 +54,131 @@ class Label:
     description: str = ""
 
 
+class _LabelRecord:
+    """Cached label data (slotted; one per label in a repository listing)."""
+    
+    __slots__ = ("node_id", "name", "color", "description")
+    
+    def __init__(self, node_id: Optional[str], name: str, color: str, description: str = ""):
+        self.node_id = node_id
+        self.name = name
+        self.color = color
+        self.description = description
+    
+    def to_dict(self) -> Dict:
+        """Return the label in the REST label object shape."""
+        return {
+            "name": self.name,
+            "color": self.color,
+            "description": self.description,
+            "node_id": self.node_id
+        }
+
+
+class _LabelIndex:
+    """
+    Label records for one repository, indexed by lowercase name.
+    
+    Records are filled in lazily from a source of GraphQL label nodes, so
+    lookups can stop as soon as the label they need has been listed.
+    """
+    
+    __slots__ = ("records", "positions", "_source", "_lock", "_fetch_lock")
+    
+    def __init__(self, source: Optional[Iterator[Dict]] = None):
+        self.records: List[_LabelRecord] = []
+        self.positions: Dict[str, int] = {}
+        self._source = source
+        # Concurrent upserts and lookups may add records
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+    
+    def get(self, name: str) -> Optional[_LabelRecord]:
+        """Return the record for a label name (case-insensitive), or None."""
+        idx = self.positions.get(name.lower())
+        return self.records[idx] if idx is not None else None
+    
+    def put(self, record: _LabelRecord, key: Optional[str] = None):
+        """Add a record, or replace the one stored under key (a lowercase name)."""
+        key = key if key is not None else record.name.lower()
+        with self._lock:
+            idx = self.positions.get(key)
+            if idx is None:
+                self.positions[key] = len(self.records)
+                self.records.append(record)
+            else:
+                self.records[idx] = record
+    
+    def fetch_next(self, seen: int) -> bool:
+        """
+        Make sure more than `seen` records are available, listing one more if needed.
+        
+        Returns:
+            False once the listing is exhausted (or failed) and no record
+            beyond `seen` exists
+        """
+        with self._fetch_lock:
+            if seen < len(self.records):
+                return True
+            if self._source is None:
+                return False
+            try:
+                node = next(self._source)
+            except StopIteration:
+                self._source = None
+                return False
+            except Exception as e:
+                logger.error(f"Failed to fetch labels: {e}")
+                self._source = None
+                return False
+            self.put(_LabelRecord(node["id"], node["name"], node["color"], node.get("description") or ""))
+            return True
+    
+    def __iter__(self) -> Iterator[_LabelRecord]:
+        """Yield records in listing order, fetching more as they are consumed."""
+        i = 0
+        while i < len(self.records) or self.fetch_next(i):
+            yield self.records[i]
+            i += 1
+    
+    def load_all(self) -> "_LabelIndex":
+        """Drain the label source so the index holds every label."""
+        for _ in self:
+            pass
+        return self
+    
+    def to_dict(self) -> Dict[str, Dict]:
+        """Return the labels as a mapping of lowercase name to label data."""
+        self.load_all()
+        return {key: self.records[idx].to_dict() for key, idx in self.positions.items()}
+
+
+class _TTLCache:
+    """Small LRU cache whose entries also expire `ttl` seconds after insertion."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return a live entry (marking it most recently used), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+    
+    def __setitem__(self, key: str, value: Any):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
 class LabelManager:
     """Manages repository labels."""
     
@@ -43,7 +189,9 @@ class LabelManager:
     ):
         self.client = client
         self.processing = processing_config
-        self._label_cache: Dict[str, Dict] = {}
+        # Label listings by "owner/repo", bounded and refreshed after LABEL_CACHE_TTL
+        self._label_cache = _TTLCache(LABEL_CACHE_SIZE, LABEL_CACHE_TTL)
+        self._cache_lock = threading.Lock()
     
     def get_existing_labels(
         self,
@@ -60,40 +208,51 @@ class LabelManager:
         Returns:
             Dictionary mapping label name (lowercase) to label data
         """
-        cache_key = f"{owner}/{repo}"
-        if cache_key in self._label_cache:
-            return self._label_cache[cache_key]
+        return self._get_label_index(owner, repo).to_dict()
+    
+    def _get_label_index(self, owner: str, repo: str) -> _LabelIndex:
+        """
+        Get the cached label index for a repository.
         
-        labels = {}
-        page = 1
-        per_page = 100
+        The index is listed lazily; call load_all() on it when every label
+        is needed.
         
-        while True:
-            try:
-                endpoint = f"/repos/{owner}/{repo}/labels"
-                response = self.client.rest_get(
-                    endpoint,
-                    params={"per_page": per_page, "page": page}
-                )
-                
-                page_labels = response.json()
-                if not page_labels:
-                    break
-                
-                for label in page_labels:
-                    labels[label["name"].lower()] = label
-                
-                if len(page_labels) < per_page:
-                    break
-                
-                page += 1
-            except Exception as e:
-                logger.error(f"Failed to fetch labels: {e}")
-                break
+        Args:
+            owner: Repository owner
+            repo: Repository name
         
-        self._label_cache[cache_key] = labels
+        Returns:
+            Label index for the repository
+        """
+        cache_key = f"{owner}/{repo}"
+        with self._cache_lock:
+            labels = self._label_cache.get(cache_key)
+            if labels is None:
+                # No prefetch: an index that lookups stop reading early stays
+                # cached, and must not hold a background fetch and its page
+                labels = _LabelIndex(self.client.iter_paginate_graphql(
+                    _LABELS_QUERY,
+                    {"owner": owner, "name": repo},
+                    page_info_path=["repository", "labels", "pageInfo"],
+                    nodes_path=["repository", "labels", "nodes"],
+                    prefetch=False
+                ))
+                self._label_cache[cache_key] = labels
         return labels
     
+    def _iter_labels(self, owner: str, repo: str) -> Iterator[_LabelRecord]:
+        """
+        Yield a repository's labels, listing further pages only as they are consumed.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+        
+        Yields:
+            Label records in listing order (cached as they arrive)
+        """
+        return iter(self._get_label_index(owner, repo))
+    
     def upsert_label(
         self,
         owner: str,
@@ -108,6 +267,67 @@ class LabelManager:
             repo: Repository name
             label: Label definition
         
+        Returns:
+            Label data or None if failed
+        """
+        existing = _LabelIndex() if self.processing.dry_run else self._get_label_index(owner, repo).load_all()
+        return self._upsert_one(owner, repo, label, existing)
+    
+    def upsert_labels(
+        self,
+        owner: str,
+        repo: str,
+        labels: Iterable[Label]
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Create or update multiple labels.
+        
+        The existing labels are listed once up front. With
+        processing.max_workers > 1 the labels are upserted concurrently;
+        results keep the input order either way.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            labels: Label definitions (any iterable; consumed once)
+        
+        Returns:
+            Dictionary mapping label name to result (or None if failed)
+        """
+        results = {}
+        existing = _LabelIndex() if self.processing.dry_run else self._get_label_index(owner, repo).load_all()
+        max_workers = self.processing.max_workers
+        
+        if max_workers <= 1:
+            for label in labels:
+                result = self._upsert_one(owner, repo, label, existing)
+                results[label.name] = result
+            return results
+        
+        labels = list(labels)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            upserted = executor.map(lambda label: self._upsert_one(owner, repo, label, existing), labels)
+            for label, result in zip(labels, upserted):
+                results[label.name] = result
+        
+        return results
+    
+    def _upsert_one(
+        self,
+        owner: str,
+        repo: str,
+        label: Label,
+        existing: _LabelIndex
+    ) -> Optional[Dict]:
+        """
+        Create or update a label against an already fetched label listing.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            label: Label definition
+            existing: Existing labels index (updated in place)
+        
         Returns:
             Label data or None if failed
         """
@@ -115,17 +335,24 @@ class LabelManager:
             logger.info(f"[DRY RUN] Would upsert label: {label.name}")
             return {"name": label.name, "color": label.color, "description": label.description}
         
-        existing = self.get_existing_labels(owner, repo)
         label_key = label.name.lower()
         
         # Normalize color (remove # if present)
         color = label.color.lstrip("#").lower()
         
         try:
-            if label_key in existing:
+            existing_label = existing.get(label_key)
+            if existing_label is not None:
+                if (
+                    existing_label.name == label.name
+                    and existing_label.color.lower() == color
+                    and existing_label.description == (label.description or "")
+                ):
+                    logger.info(f"Label unchanged: {label.name}")
+                    return existing_label.to_dict()
+                
                 # Update existing label
-                existing_label = existing[label_key]
-                endpoint = f"/repos/{owner}/{repo}/labels/{existing_label['name']}"
+                endpoint = f"/repos/{owner}/{repo}/labels/{existing_label.name}"
                 response = self.client.rest_patch(
                     endpoint,
                     json_data={
@@ -134,7 +361,7 @@ class LabelManager:
                         "description": label.description
                     }
                 )
-                result = response.json()
+                result = json_utils.loads(response.content)
                 logger.info(f"Updated label: {label.name}")
             else:
                 # Create new label
@@ -147,39 +374,24 @@ class LabelManager:
                         "description": label.description
                     }
                 )
-                result = response.json()
+                result = json_utils.loads(response.content)
                 logger.info(f"Created label: {label.name}")
             
+            # Keep the cached listing current for later lookups
+            existing.put(
+                _LabelRecord(
+                    result.get("node_id"),
+                    result.get("name", label.name),
+                    result.get("color", color),
+                    result.get("description") or ""
+                ),
+                label_key
+            )
             return result
         except Exception as e:
             logger.error(f"Failed to upsert label {label.name}: {e}")
             return None
     
-    def upsert_labels(
-        self,
-        owner: str,
-        repo: str,
-        labels: List[Label]
-    ) -> Dict[str, Optional[Dict]]:
-        """
-        Create or update multiple labels.
-        
-        Args:
-            owner: Repository owner
-            repo: Repository name
-            labels: List of label definitions
-        
-        Returns:
-            Dictionary mapping label name to result (or None if failed)
-        """
-        results = {}
-        
-        for label in labels:
-            result = self.upsert_label(owner, repo, label)
-            results[label.name] = result
-        
-        return results
-    
     def get_label_node_id(
         self,
         owner: str,
@@ -197,11 +409,10 @@ class LabelManager:
         Returns:
             Label node ID or None if not found
         """
-        existing = self.get_existing_labels(owner, repo)
-        label_key = label_name.lower()
-        
-        if label_key in existing:
-            return existing[label_key].get("node_id")
-        
-        return None
+        labels = self._get_label_index(owner, repo)
+        record = labels.get(label_name)
+        if record is None:
+            label_key = label_name.lower()
+            record = next((r for r in self._iter_labels(owner, repo) if r.name.lower() == label_key), None)
+        return record.node_id if record is not None else None
 
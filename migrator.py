@@ -18,27 +18,85 @@ extraction through mapping to final migration.
 """
 
 import logging
+import dataclasses
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import pandas as pd
+from typing import TYPE_CHECKING, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 
+from . import json_utils
 from .config import Config
 from .github_client import GitHubClient
 from .excel_handler import ExcelHandler
 from .field_mapper import FieldMapper
-from .issue_manager import IssueManager
+from .issue_manager import MAX_CREATE_BATCH, IssueManager, IssueResult
 from .relationship_manager import RelationshipManager
 from .label_manager import LabelManager, Label
 
+# pandas is imported lazily so commands that never touch Excel start fast
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# GitHub caps GraphQL connection page sizes at 100 nodes
+MAX_PAGE_SIZE = 100
+
 
 class GitHubMigrator:
     """Main orchestrator for GitHub project migration."""
     
-    def __init__(self, config: Config):
+    # Sheet column -> (target project field ID, field type)
+    _FIELD_MAPPINGS: ClassVar[Dict[str, Tuple[str, str]]] = {
+        "startDate": ("PVTF_lADODKp0h84BGorzzg3n8DA", "date"),
+        "endDate": ("PVTF_lADODKp0h84BGorzzg3n8DE", "date"),
+        "iterationId": ("PVTIF_lADODKp0h84BGorzzg3n8C8", "iteration"),
+        "quarterIterationId": ("PVTIF_lADODKp0h84BGorzzg3n-8w", "iteration"),
+        "statusOptionId": ("PVTSSF_lADODKp0h84BGorzzg3n78s", "singleSelect"),
+        "teamOptionId": ("PVTSSF_lADODKp0h84BGorzzg3n9y8", "singleSelect"),
+        "priorityOptionId": ("PVTSSF_lADODKp0h84BGorzzg3n8Cw", "singleSelect"),
+        "readinessOptionId": ("PVTSSF_lADODKp0h84BGorzzg3oCKI", "singleSelect"),
+        "estimatedEffortOptionId": ("PVTSSF_lADODKp0h84BGorzzg3n8C0", "singleSelect"),
+    }
+    
+    # Sheet column -> FieldMapper method mapping its values (see map_fields)
+    _VALUE_MAPPERS: ClassVar[Dict[str, str]] = {
+        "iterationId": "map_iteration",
+        "quarterIterationId": "map_quarter",
+        "statusOptionId": "map_status",
+        "teamOptionId": "map_team",
+        "priorityOptionId": "map_priority",
+        "readinessOptionId": "map_readiness",
+        "estimatedEffortOptionId": "map_effort",
+        "milestoneId": "map_milestone",
+    }
+    _MULTI_VALUE_MAPPERS: ClassVar[Dict[str, str]] = {
+        "labelIds": "map_labels_series",
+        "assigneeIds": "map_users_series",
+        "commentAuthors": "map_users_series",
+    }
+    _DATE_COLUMNS: ClassVar[Tuple[str, ...]] = ("startDate", "endDate")
+    
+    def __init__(self, config: Config, client: Optional[GitHubClient] = None):
+        """
+        Create a migrator.
+        
+        Args:
+            config: Migration configuration
+            client: Optional existing GitHubClient to reuse (and its connection
+                pool). A provided client is not closed by close().
+        """
         self.config = config
-        self.client = GitHubClient(config.github)
+        self._owns_client = client is None
+        if client is None:
+            # All workers share the client's session; keep a pooled connection
+            # per worker so none of them has to reconnect for each request
+            github = config.github
+            if github.pool_maxsize < config.processing.max_workers:
+                github = dataclasses.replace(github, pool_maxsize=config.processing.max_workers)
+            client = GitHubClient(github)
+        self.client = client
         self.excel = ExcelHandler(config.processing.multi_value_separator)
         self.field_mapper = FieldMapper(config.field_mapping)
         self.issue_manager = IssueManager(
@@ -63,21 +121,30 @@ class GitHubMigrator:
         self,
         project_id: str,
         output_path: Path,
-        limit: Optional[int] = None
-    ) -> pd.DataFrame:
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None
+    ) -> "pd.DataFrame":
         """
         Extract issues from a GitHub project.
         
         Args:
             project_id: Project node ID
-            output_path: Output Excel file path
+            output_path: Output Excel file path (or .parquet)
             limit: Maximum number of issues to extract (None for all)
+            page_size: Project items fetched per GraphQL request (max 100,
+                defaults to processing.batch_size)
         
         Returns:
             DataFrame with extracted issues
         """
+        import pandas as pd
+        
         logger.info(f"Extracting issues from project {project_id}")
         
+        page_size = min(page_size or self.config.processing.batch_size, MAX_PAGE_SIZE)
+        if limit:
+            page_size = min(page_size, limit)
+        
         query = """
         query($projectId: ID!, $first: Int!, $after: String) {
           node(id: $projectId) {
@@ -126,19 +193,19 @@ class GitHubMigrator:
         }
         """
         
-        rows = []
+        # Column lists rather than one dict per issue: far less memory on large projects
+        columns: Dict[str, List[Any]] = {}
         count = 0
         
-        for item in self.client.paginate_graphql(
+        # Pages are pulled lazily, so hitting the limit stops further requests;
+        # prefetching is skipped then to avoid fetching a page that is never used
+        for item in self.client.iter_paginate_graphql(
             query,
-            {"projectId": project_id, "first": 100},
+            {"projectId": project_id, "first": page_size},
             page_info_path=["node", "items", "pageInfo"],
             nodes_path=["node", "items", "nodes"],
-            max_pages=None if limit is None else (limit // 100 + 1)
+            prefetch=not limit
         ):
-            if limit and count >= limit:
-                break
-            
             content = item.get("content")
             if not content or content.get("__typename") != "Issue":
                 continue
@@ -147,24 +214,25 @@ class GitHubMigrator:
             repo = issue.get("repository", {})
             
             # Extract assignees
-            assignees = [a.get("name") or a.get("login", "") 
-                        for a in issue.get("assignees", {}).get("nodes", [])]
+            assignees = [a.get("name") or a.get("login", "")
+                         for a in issue.get("assignees", {}).get("nodes", [])]
             
             # Extract labels
-            labels = [l.get("name", "") 
+            labels = [l.get("name", "")
                       for l in issue.get("labels", {}).get("nodes", [])]
             
-            # Extract comments
-            comments = [c.get("body", "") 
-                       for c in issue.get("comments", {}).get("nodes", [])]
-            comment_authors = [
-                (c.get("author", {}).get("name") or c.get("author", {}).get("login", ""))
-                for c in issue.get("comments", {}).get("nodes", [])
-            ]
+            # Extract comments and their authors in one pass (deleted users
+            # come back as a null author)
+            comments = []
+            comment_authors = []
+            for c in issue.get("comments", {}).get("nodes", []):
+                author = c.get("author") or {}
+                comments.append(c.get("body", ""))
+                comment_authors.append(author.get("name") or author.get("login", ""))
             
             row = {
-                "issueTitle": self.excel.sanitize_text(issue.get("title", "")),
-                "issueBody": self.excel.sanitize_text(issue.get("body", "")),
+                "issueTitle": issue.get("title", ""),
+                "issueBody": issue.get("body", ""),
                 "assigneeIds": self.excel.join_multi_value(assignees),
                 "labelIds": self.excel.join_multi_value(labels),
                 "comments": self.excel.join_multi_value(comments),
@@ -174,89 +242,68 @@ class GitHubMigrator:
                 "repoId": repo.get("id", ""),
             }
             
-            rows.append(row)
+            for name, value in row.items():
+                columns.setdefault(name, []).append(value)
             count += 1
+            
+            # Stop before the generator requests another page
+            if limit and count >= limit:
+                break
         
-        df = pd.DataFrame(rows)
-        self.excel.write_excel({"Issues": df}, output_path)
+        df = pd.DataFrame(columns)
+        
+        # Strip characters that are illegal in xlsx cells in one pass per column
+        for col in ("issueTitle", "issueBody"):
+            if col in df.columns:
+                df[col] = self.excel.sanitize_text_series(df[col])
+        
+        self.excel.write_dataframe(df, output_path, "Issues")
         logger.info(f"Extracted {len(df)} issues to {output_path}")
         
         return df
     
-    def map_fields(self, input_path: Path, output_path: Path) -> pd.DataFrame:
+    def map_fields(self, input_path: Path, output_path: Path) -> "pd.DataFrame":
         """
         Map text values to GitHub IDs in an Excel file.
         
         Args:
             input_path: Input Excel file path
-            output_path: Output Excel file path
+            output_path: Output Excel file path (or .parquet for a single
+                Issues table)
         
         Returns:
             Mapped DataFrame
         """
+        import pandas as pd
+        
         logger.info(f"Mapping fields in {input_path}")
         
         sheets = self.excel.read_excel(input_path)
         processed_sheets = {}
+        mapper = self.field_mapper
+        separator = self.config.processing.multi_value_separator
         
         for sheet_name, df in sheets.items():
             df = df.copy()
             
-            # Map each field
-            if "iterationId" in df.columns:
-                df["iterationId"] = df["iterationId"].apply(self.field_mapper.map_iteration)
-            
-            if "quarterIterationId" in df.columns:
-                df["quarterIterationId"] = df["quarterIterationId"].apply(self.field_mapper.map_quarter)
-            
-            if "statusOptionId" in df.columns:
-                df["statusOptionId"] = df["statusOptionId"].apply(self.field_mapper.map_status)
-            
-            if "teamOptionId" in df.columns:
-                df["teamOptionId"] = df["teamOptionId"].apply(self.field_mapper.map_team)
+            present = set(df.columns)
             
-            if "priorityOptionId" in df.columns:
-                df["priorityOptionId"] = df["priorityOptionId"].apply(self.field_mapper.map_priority)
-            
-            if "readinessOptionId" in df.columns:
-                df["readinessOptionId"] = df["readinessOptionId"].apply(self.field_mapper.map_readiness)
-            
-            if "estimatedEffortOptionId" in df.columns:
-                df["estimatedEffortOptionId"] = df["estimatedEffortOptionId"].apply(self.field_mapper.map_effort)
-            
-            if "milestoneId" in df.columns:
-                df["milestoneId"] = df["milestoneId"].apply(self.field_mapper.map_milestone)
-            
-            if "labelIds" in df.columns:
-                df["labelIds"] = df["labelIds"].apply(
-                    lambda x: self.field_mapper.map_labels(x, self.config.processing.multi_value_separator)
-                )
-            
-            if "assigneeIds" in df.columns:
-                df["assigneeIds"] = df["assigneeIds"].apply(
-                    lambda x: self.field_mapper.map_users(x, self.config.processing.multi_value_separator)
-                )
+            # Map each field
+            for col, method in self._VALUE_MAPPERS.items():
+                if col in present:
+                    df[col] = mapper.map_series(df[col], getattr(mapper, method))
             
-            if "commentAuthors" in df.columns:
-                df["commentAuthors"] = df["commentAuthors"].apply(
-                    lambda x: self.field_mapper.map_users(x, self.config.processing.multi_value_separator)
-                )
+            for col, method in self._MULTI_VALUE_MAPPERS.items():
+                if col in present:
+                    df[col] = getattr(mapper, method)(df[col], separator)
             
-            if "issueTypeId" in df.columns and "labelIds" in df.columns:
-                df["issueTypeId"] = df.apply(
-                    lambda row: self.field_mapper.map_issue_type(
-                        row.get("issueTypeId"),
-                        row.get("labelIds")
-                    ),
-                    axis=1
-                )
+            if {"issueTypeId", "labelIds"} <= present:
+                df["issueTypeId"] = mapper.map_issue_type_series(df["issueTypeId"], df["labelIds"], separator)
             
             # Format dates
-            if "startDate" in df.columns:
-                df["startDate"] = df["startDate"].apply(self.field_mapper.format_date)
-            
-            if "endDate" in df.columns:
-                df["endDate"] = df["endDate"].apply(self.field_mapper.format_date)
+            for col in self._DATE_COLUMNS:
+                if col in present:
+                    df[col] = mapper.format_date_series(df[col])
             
             # Add repo and project IDs
             df["repoId"] = self.config.project.target_repo_id
@@ -264,7 +311,13 @@ class GitHubMigrator:
             
             processed_sheets[sheet_name] = df
         
-        self.excel.write_excel(processed_sheets, output_path)
+        if output_path.suffix.lower() == ".parquet":
+            # Parquet holds a single table: keep the sheet migrate_issues reads
+            names = list(processed_sheets.keys())
+            issues_sheet = self.excel.match_sheet_name(names, "Issues") or names[0]
+            self.excel.write_dataframe(processed_sheets[issues_sheet], output_path)
+        else:
+            self.excel.write_excel(processed_sheets, output_path)
         logger.info(f"Mapped fields written to {output_path}")
         
         return list(processed_sheets.values())[0] if processed_sheets else pd.DataFrame()
@@ -278,7 +331,7 @@ class GitHubMigrator:
         Migrate issues from Excel file to GitHub.
         
         Args:
-            input_path: Input Excel file path
+            input_path: Input Excel (or .parquet) file path
             output_path: Optional output Excel file path for results
         
         Returns:
@@ -286,11 +339,22 @@ class GitHubMigrator:
         """
         logger.info(f"Migrating issues from {input_path}")
         
-        sheets = self.excel.read_excel(input_path)
-        sheet_name = self.excel.find_sheet_by_name(input_path, "Issues") or list(sheets.keys())[0]
-        df = sheets[sheet_name]
+        df = self.excel.read_dataframe(input_path, "Issues")
+        
+        # Normalize text columns once for the whole sheet (blank cells -> "")
+        text_columns = ["repoId", "projectId", "issueTitle", "issueBody", "milestoneId", "issueTypeId"]
+        for col in df.columns.intersection(text_columns + list(self._FIELD_MAPPINGS)):
+            df[col] = self.excel.normalize_text_series(df[col])
+        
+        # Drop rows without a title before any per-row work (the index keeps
+        # the sheet row numbers used in results and errors)
+        if "issueTitle" not in df.columns:
+            df["issueTitle"] = ""
+        untitled = df["issueTitle"] == ""
+        for idx in df.index[untitled]:
+            logger.warning(f"Row {idx}: Skipping - no title")
+        df = df[~untitled]
         
-        results = []
         summary = {
             "total": len(df),
             "success": 0,
@@ -298,112 +362,254 @@ class GitHubMigrator:
             "errors": []
         }
         
-        for idx, row in df.iterrows():
+        # Result rows are appended to a JSON Lines file as they complete, so a
+        # run that dies midway keeps its progress and results are never all in
+        # memory; the Excel file is written from it at the end
+        progress_path = output_path.with_suffix(".jsonl") if output_path else None
+        if progress_path:
+            progress_path.parent.mkdir(parents=True, exist_ok=True)
+            self._keep_previous_progress(progress_path)
+        progress = open(progress_path, "wb") if progress_path else None
+        # Sheet position -> errors of each failed row (reported in sheet order)
+        errors_by_pos: Dict[int, List[str]] = {}
+        
+        try:
+            for rows_by_pos in self._iter_issue_results(df):
+                for pos, (result_row, errors) in rows_by_pos.items():
+                    if result_row["success"]:
+                        summary["success"] += 1
+                    else:
+                        summary["failed"] += 1
+                        errors_by_pos[pos] = errors
+                    if progress:
+                        progress.write(json_utils.dumps(result_row) + b"\n")
+                if progress:
+                    progress.flush()
+        finally:
+            if progress:
+                progress.close()
+        
+        for pos in sorted(errors_by_pos):
+            summary["errors"].extend(errors_by_pos[pos])
+        
+        # Write results
+        if progress_path:
+            self._write_progress_results(progress_path, output_path)
+            logger.info(f"Results written to {output_path}")
+        
+        logger.info(f"Migration complete: {summary['success']} success, {summary['failed']} failed")
+        return summary
+    
+    def _iter_issue_results(
+        self,
+        df: "pd.DataFrame"
+    ) -> Iterator[Dict[int, Tuple[Dict[str, Any], List[str]]]]:
+        """
+        Create an issue for every row of a normalized Issues sheet.
+        
+        Args:
+            df: Issues sheet with text columns normalized and untitled rows dropped
+        
+        Yields:
+            Dictionaries mapping sheet position to (result row, errors for the
+            summary): rows that could not be prepared first, then each batch
+            as it completes
+        """
+        # Nothing is sent in a dry run, so skip building the issue arguments
+        # (titles have already been checked)
+        if self.config.processing.dry_run:
+            titles = df["issueTitle"].tolist()
+            dry_run_results = self.issue_manager.create_complete_issues([{"title": title} for title in titles])
+            yield {
+                pos: (self._issue_result_row(idx, title, result), result.errors)
+                for pos, (idx, title, result) in enumerate(zip(df.index, titles, dry_run_results))
+            }
+            return
+        
+        # Parse multi-value columns once for the whole sheet
+        multi_value_columns = ("assigneeIds", "labelIds", "comments", "commentAuthors")
+        parsed = {
+            col: (
+                self.excel.parse_multi_value_series(df[col]).tolist()
+                if col in df.columns
+                else [[] for _ in range(len(df))]
+            )
+            for col in multi_value_columns
+        }
+        
+        # First pass: turn rows into create_complete_issue arguments
+        # Sheet position -> (result row, errors for the summary)
+        rows_by_pos: Dict[int, Tuple[Dict[str, Any], List[str]]] = {}
+        pending: List[Tuple[int, Any, Dict[str, Any]]] = []
+        
+        # Resolved once rather than per row
+        default_repo_id = self.config.project.target_repo_id
+        default_project_id = self.config.project.target_project_id
+        field_mappings = self._FIELD_MAPPINGS.items()
+        
+        # Plain dict rows: key lookups are much cheaper than on a Series per row
+        for pos, (idx, row) in enumerate(zip(df.index, df.to_dict("records"))):
             try:
                 # Extract data
-                repo_id = str(row.get("repoId", self.config.project.target_repo_id)).strip()
-                project_id = str(row.get("projectId", self.config.project.target_project_id)).strip()
-                title = str(row.get("issueTitle", "")).strip()
-                body = str(row.get("issueBody", "")).strip()
-                
-                if not title:
-                    logger.warning(f"Row {idx}: Skipping - no title")
-                    continue
+                repo_id = row.get("repoId") or default_repo_id
+                project_id = row.get("projectId") or default_project_id
+                title = row["issueTitle"]
+                body = row.get("issueBody", "")
                 
                 # Parse multi-value fields
-                assignee_ids = self.excel.parse_multi_value(row.get("assigneeIds"))
-                label_ids = self.excel.parse_multi_value(row.get("labelIds"))
-                comments = self.excel.parse_multi_value(row.get("comments"))
-                comment_authors = self.excel.parse_multi_value(row.get("commentAuthors"))
+                assignee_ids = parsed["assigneeIds"][pos]
+                label_ids = parsed["labelIds"][pos]
+                comments = parsed["comments"][pos]
+                comment_authors = parsed["commentAuthors"][pos]
                 
                 # Build project fields dict
                 project_fields = {}
-                field_mappings = {
-                    "startDate": ("PVTF_lADODKp0h84BGorzzg3n8DA", "date"),
-                    "endDate": ("PVTF_lADODKp0h84BGorzzg3n8DE", "date"),
-                    "iterationId": ("PVTIF_lADODKp0h84BGorzzg3n8C8", "iteration"),
-                    "quarterIterationId": ("PVTIF_lADODKp0h84BGorzzg3n-8w", "iteration"),
-                    "statusOptionId": ("PVTSSF_lADODKp0h84BGorzzg3n78s", "singleSelect"),
-                    "teamOptionId": ("PVTSSF_lADODKp0h84BGorzzg3n9y8", "singleSelect"),
-                    "priorityOptionId": ("PVTSSF_lADODKp0h84BGorzzg3n8Cw", "singleSelect"),
-                    "readinessOptionId": ("PVTSSF_lADODKp0h84BGorzzg3oCKI", "singleSelect"),
-                    "estimatedEffortOptionId": ("PVTSSF_lADODKp0h84BGorzzg3n8C0", "singleSelect"),
-                }
-                
-                for field_name, (field_id, field_type) in field_mappings.items():
+                for field_name, (field_id, field_type) in field_mappings:
                     value = row.get(field_name)
-                    if value and str(value).strip():
+                    if value:
                         project_fields[field_id] = {
-                            "value": str(value).strip(),
+                            "value": value,
                             "type": field_type
                         }
                 
-                # Add comments with authors
-                comments_with_authors = []
-                for i, comment in enumerate(comments):
-                    if i < len(comment_authors) and comment_authors[i]:
-                        author = comment_authors[i]
-                        comments_with_authors.append(f"[Author: {author}] {comment}")
-                    else:
-                        comments_with_authors.append(comment)
-                
-                # Create issue
-                result = self.issue_manager.create_complete_issue(
-                    repo_id=repo_id,
-                    project_id=project_id,
-                    title=title,
-                    body=body,
-                    milestone_id=str(row.get("milestoneId", "")).strip() or None,
-                    issue_type_id=str(row.get("issueTypeId", "")).strip() or None,
-                    assignee_ids=assignee_ids if assignee_ids else None,
-                    project_fields=project_fields if project_fields else None,
-                    comments=comments_with_authors if comments_with_authors else None,
-                    label_ids=label_ids if label_ids else None
-                )
+                # Add comments with authors (comments may outnumber authors)
+                comments_with_authors = [
+                    f"[Author: {author}] {comment}" if author else comment
+                    for comment, author in zip(comments, chain(comment_authors, repeat("")))
+                ]
                 
-                result_row = {
-                    "row": idx,
+                pending.append((pos, idx, {
+                    "repo_id": repo_id,
+                    "project_id": project_id,
                     "title": title,
-                    "success": result.success,
-                    "issueId": result.issue_id,
-                    "issueNumber": result.issue_number,
-                    "issueUrl": result.issue_url,
-                    "projectItemId": result.project_item_id,
-                    "errors": "; ".join(result.errors) if result.errors else ""
-                }
-                
-                results.append(result_row)
-                
-                if result.success:
-                    summary["success"] += 1
-                else:
-                    summary["failed"] += 1
-                    summary["errors"].extend(result.errors)
-                
+                    "body": body,
+                    "milestone_id": row.get("milestoneId") or None,
+                    "issue_type_id": row.get("issueTypeId") or None,
+                    "assignee_ids": assignee_ids if assignee_ids else None,
+                    "project_fields": project_fields if project_fields else None,
+                    "comments": comments_with_authors if comments_with_authors else None,
+                    "label_ids": label_ids if label_ids else None
+                }))
+            
             except Exception as e:
                 logger.error(f"Row {idx} failed: {e}")
-                summary["failed"] += 1
-                summary["errors"].append(f"Row {idx}: {str(e)}")
-                results.append({
+                rows_by_pos[pos] = ({
                     "row": idx,
-                    "title": str(row.get("issueTitle", "")),
+                    "title": row.get("issueTitle", ""),
                     "success": False,
                     "errors": str(e)
-                })
+                }, [f"Row {idx}: {str(e)}"])
+        
+        # Second pass: create issues, several per createIssue request; with
+        # processing.max_workers > 1 the batches are sent concurrently
+        batch_size = min(self.config.processing.batch_size, MAX_CREATE_BATCH)
+        batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+        yield rows_by_pos
+        yield from self._run_parallel(self._migrate_issue_batch, batches)
+    
+    @staticmethod
+    def _keep_previous_progress(progress_path: Path):
+        """
+        Move aside a progress file left by an interrupted run instead of overwriting it.
         
-        # Write results
-        if output_path:
-            results_df = pd.DataFrame(results)
-            self.excel.write_excel({"Results": results_df}, output_path)
-            logger.info(f"Results written to {output_path}")
+        Args:
+            progress_path: JSON Lines progress file about to be written
+        """
+        if not progress_path.exists() or progress_path.stat().st_size == 0:
+            return
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(progress_path.stat().st_mtime))
+        kept = progress_path.with_name(f"{progress_path.stem}.{stamp}{progress_path.suffix}")
+        counter = 1
+        while kept.exists():
+            kept = progress_path.with_name(f"{progress_path.stem}.{stamp}-{counter}{progress_path.suffix}")
+            counter += 1
+        logger.warning(
+            f"{progress_path} holds results of an earlier, interrupted run "
+            f"(issues it lists were already created); moved it to {kept}"
+        )
+        progress_path.rename(kept)
+    
+    def _write_progress_results(self, progress_path: Path, output_path: Path):
+        """
+        Convert a JSON Lines file of result rows to the Results sheet.
         
-        logger.info(f"Migration complete: {summary['success']} success, {summary['failed']} failed")
-        return summary
+        Rows are written in sheet order and the progress file is removed
+        once the Excel file exists.
+        
+        Args:
+            progress_path: JSON Lines file written during the run
+            output_path: Output Excel file path
+        """
+        with open(progress_path, "rb") as f:
+            results = [json_utils.loads(line) for line in f if line.strip()]
+        results.sort(key=lambda result_row: result_row["row"])
+        self.excel.write_records({"Results": results}, output_path)
+        progress_path.unlink()
+    
+    def _migrate_issue_batch(
+        self,
+        batch: List[Tuple[int, Any, Dict[str, Any]]]
+    ) -> Dict[int, Tuple[Dict[str, Any], List[str]]]:
+        """
+        Create one batch of issues.
+        
+        Args:
+            batch: (sheet position, index, create_complete_issue arguments) tuples
+        
+        Returns:
+            Dictionary mapping sheet position to (result row, errors for the summary)
+        """
+        try:
+            batch_results = self.issue_manager.create_complete_issues(
+                [spec for _, _, spec in batch],
+                len(batch)
+            )
+        except Exception as e:
+            rows = {}
+            for pos, idx, spec in batch:
+                logger.error(f"Row {idx} failed: {e}")
+                rows[pos] = ({
+                    "row": idx,
+                    "title": spec["title"],
+                    "success": False,
+                    "errors": str(e)
+                }, [f"Row {idx}: {str(e)}"])
+            return rows
+        
+        rows = {}
+        for (pos, idx, spec), result in zip(batch, batch_results):
+            rows[pos] = (self._issue_result_row(idx, spec["title"], result), result.errors)
+        return rows
+    
+    @staticmethod
+    def _issue_result_row(idx: Any, title: str, result: IssueResult) -> Dict[str, Any]:
+        """
+        Build the Results sheet row for a created (or failed) issue.
+        
+        Args:
+            idx: Sheet row index
+            title: Issue title
+            result: Result of create_complete_issue(s)
+        
+        Returns:
+            Result row dictionary
+        """
+        return {
+            "row": idx,
+            "title": title,
+            "success": result.success,
+            "issueId": result.issue_id,
+            "issueNumber": result.issue_number,
+            "issueUrl": result.issue_url,
+            "projectItemId": result.project_item_id,
+            "errors": "; ".join(result.errors) if result.errors else ""
+        }
     
     def migrate_relationships(
         self,
         input_path: Path,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        edges_path: Optional[Path] = None
     ) -> Dict[str, Any]:
         """
         Migrate issue relationships from Excel file.
@@ -411,6 +617,9 @@ class GitHubMigrator:
         Args:
             input_path: Input Excel file path with relationships
             output_path: Optional output Excel file path for results
+            edges_path: Optional JSON file of processed relationships; edges
+                listed there are skipped, and it is updated afterwards (even
+                if the run is interrupted) so a re-run does not repeat them
         
         Returns:
             Summary dictionary
@@ -428,61 +637,118 @@ class GitHubMigrator:
             "errors": []
         }
         
-        for idx, row in df.iterrows():
-            try:
-                issue_id = str(row.get("issueTitle", "")).strip()
-                if not issue_id:
-                    continue
-                
-                parent_id = str(row.get("parentIssue", "")).strip() or None
-                sub_issues = self.excel.parse_multi_value(row.get("subIssues"))
-                blocked_by = self.excel.parse_multi_value(row.get("blockedBy"))
-                blocking = self.excel.parse_multi_value(row.get("blocking"))
-                
-                result = self.relationship_manager.process_relationships(
-                    issue_id=issue_id,
-                    parent_issue_id=parent_id,
-                    sub_issue_ids=sub_issues if sub_issues else None,
-                    blocked_by_ids=blocked_by if blocked_by else None,
-                    blocking_ids=blocking if blocking else None
-                )
-                
-                results.append({
-                    "row": idx,
-                    "issueId": issue_id,
-                    "relationships_added": result.relationships_added,
-                    "errors": "; ".join(result.errors) if result.errors else ""
-                })
-                
-                summary["relationships_added"] += result.relationships_added
-                if result.errors:
-                    summary["errors"].extend(result.errors)
-                
-            except Exception as e:
-                logger.error(f"Row {idx} failed: {e}")
-                summary["errors"].append(f"Row {idx}: {str(e)}")
+        for col in df.columns.intersection(["issueTitle", "parentIssue"]):
+            df[col] = self.excel.normalize_text_series(df[col])
+        
+        if edges_path:
+            loaded = self.relationship_manager.load_processed_edges(edges_path)
+            if loaded:
+                logger.info(f"Skipping {loaded} relationships recorded in {edges_path}")
+        
+        # Rows are independent, so they can be processed concurrently
+        rows = zip(df.index, df.to_dict("records"))
+        row_results = self._run_parallel(self._migrate_relationship_row, rows)
+        try:
+            for result_row, errors in row_results:
+                if result_row is not None:
+                    results.append(result_row)
+                    summary["relationships_added"] += result_row["relationships_added"]
+                summary["errors"].extend(errors)
+        finally:
+            # Wait for running rows so an interrupted run records what it added
+            row_results.close()
+            # Dry runs mark edges as processed without adding them, so keep the file as is
+            if edges_path and not self.config.processing.dry_run:
+                self.relationship_manager.save_processed_edges(edges_path)
         
         if output_path:
-            results_df = pd.DataFrame(results)
-            self.excel.write_excel({"Results": results_df}, output_path)
+            self.excel.write_records({"Results": results}, output_path)
         
         logger.info(f"Relationships migration complete: {summary['relationships_added']} added")
         return summary
     
+    def _migrate_relationship_row(
+        self,
+        item: Tuple[Any, Dict[str, Any]]
+    ) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """
+        Process the relationships of a single sheet row.
+        
+        Args:
+            item: (index, row dict) pair
+        
+        Returns:
+            Tuple of (result row or None if skipped/failed, list of errors)
+        """
+        idx, row = item
+        try:
+            issue_id = row.get("issueTitle", "")
+            if not issue_id:
+                return None, []
+            
+            parent_id = row.get("parentIssue") or None
+            sub_issues = self.excel.parse_multi_value(row.get("subIssues"))
+            blocked_by = self.excel.parse_multi_value(row.get("blockedBy"))
+            blocking = self.excel.parse_multi_value(row.get("blocking"))
+            
+            result = self.relationship_manager.process_relationships(
+                issue_id=issue_id,
+                parent_issue_id=parent_id,
+                sub_issue_ids=sub_issues if sub_issues else None,
+                blocked_by_ids=blocked_by if blocked_by else None,
+                blocking_ids=blocking if blocking else None
+            )
+            
+            return {
+                "row": idx,
+                "issueId": issue_id,
+                "relationships_added": result.relationships_added,
+                "errors": "; ".join(result.errors) if result.errors else ""
+            }, result.errors
+        
+        except Exception as e:
+            logger.error(f"Row {idx} failed: {e}")
+            return None, [f"Row {idx}: {str(e)}"]
+    
+    def _run_parallel(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any]
+    ) -> Iterator[Any]:
+        """
+        Apply func to every item using up to processing.max_workers threads.
+        
+        Args:
+            func: Function to apply (must handle its own errors)
+            items: Items to process
+        
+        Yields:
+            Results in the same order as items, each as soon as it (and every
+            earlier one) is done
+        """
+        max_workers = self.config.processing.max_workers
+        if max_workers <= 1:
+            for item in items:
+                yield func(item)
+            return
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(func, items)
+    
     def migrate_labels(
         self,
-        labels: List[Label]
+        labels: Iterable[Label]
     ) -> Dict[str, Any]:
         """
         Migrate labels to target repository.
         
         Args:
-            labels: List of Label objects
+            labels: Label objects (any iterable; consumed once)
         
         Returns:
             Summary dictionary
         """
-        logger.info(f"Migrating {len(labels)} labels")
+        logger.info("Migrating labels")
         
         owner = self.config.project.target_owner
         repo = self.config.project.target_repo
@@ -490,7 +756,7 @@ class GitHubMigrator:
         results = self.label_manager.upsert_labels(owner, repo, labels)
         
         summary = {
-            "total": len(labels),
+            "total": len(results),
             "success": sum(1 for r in results.values() if r is not None),
             "failed": sum(1 for r in results.values() if r is None)
         }
@@ -500,5 +766,6 @@ class GitHubMigrator:
     
     def close(self):
         """Close connections and cleanup."""
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
 
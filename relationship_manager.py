@@ -16,14 +16,47 @@ repository.
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Tuple, Set
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional, List, Tuple, Set
 from dataclasses import dataclass
 
-from .github_client import GitHubClient
+from . import json_utils
+from .github_client import GitHubClient, alias_failures, alias_variables, build_aliased_document
 from .config import ProcessingConfig
 
 logger = logging.getLogger(__name__)
 
+# nodes(ids:) accepts at most 100 IDs per request
+_ISSUE_CONTEXTS_QUERY = """
+query ($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on Issue {
+      id
+      number
+      databaseId
+      repository {
+        name
+        owner { login }
+      }
+    }
+  }
+}
+"""
+MAX_NODES_PER_QUERY = 100
+
+# Relationship kinds in processed edge keys
+SUB_ISSUE = "sub_issue"
+BLOCKED_BY = "blocked_by"
+
+# Upper bound on addSubIssue mutations sent in one request
+MAX_SUB_ISSUE_BATCH = 25
+
+_ADD_SUB_ISSUE_FIELD = (
+    "addSubIssue(input: { issueId: $parent, subIssueId: $child }) { subIssue { id } }",
+    {"parent": "ID!", "child": "ID!"}
+)
+
 
 @dataclass
 class RelationshipResult:
@@ -47,7 +80,80 @@ class RelationshipManager:
     ):
         self.client = client
         self.processing = processing_config
-        self._processed_edges: Set[Tuple[str, str]] = set()
+        # (kind, source, target): kind is SUB_ISSUE or BLOCKED_BY, so a parent
+        # link and a dependency between the same two issues do not collide
+        self._processed_edges: Set[Tuple[str, str, str]] = set()
+        self._edges_lock = threading.Lock()
+        # Issue node ID -> (owner, repo, number, databaseId); issues are looked up many times
+        self._context_cache: Dict[str, Tuple[str, str, int, int]] = {}
+        self._context_lock = threading.Lock()
+    
+    def _claim_edge(self, edge_key: Tuple[str, str, str]) -> bool:
+        """
+        Reserve an edge for processing (safe to call from multiple threads).
+        
+        Args:
+            edge_key: (kind, source, target) with issue node IDs
+        
+        Returns:
+            True if the caller should process the edge, False if it has
+            already been processed or is being processed by another thread
+        """
+        with self._edges_lock:
+            if edge_key in self._processed_edges:
+                return False
+            self._processed_edges.add(edge_key)
+            return True
+    
+    def _release_edge(self, edge_key: Tuple[str, str, str]):
+        """Forget a claimed edge after a failed attempt so it can be retried."""
+        with self._edges_lock:
+            self._processed_edges.discard(edge_key)
+    
+    def _filter_new(self, edges: Iterable[Tuple[str, str, str]]) -> List[Tuple[str, str, str]]:
+        """
+        Drop edges that have already been processed (and duplicates).
+        
+        Args:
+            edges: (kind, source, target) edge keys
+        
+        Returns:
+            Edges not processed yet, in input order
+        """
+        with self._edges_lock:
+            return [edge for edge in dict.fromkeys(edges) if edge not in self._processed_edges]
+    
+    def load_processed_edges(self, path: Path) -> int:
+        """
+        Mark the edges recorded by save_processed_edges as processed.
+        
+        Lets a re-run skip relationships a previous run already added.
+        
+        Args:
+            path: JSON file written by save_processed_edges (ignored if missing)
+        
+        Returns:
+            Number of edges loaded
+        """
+        if not path.exists():
+            return 0
+        
+        edges = [(kind, source, target) for kind, source, target in json_utils.load_file(path)]
+        with self._edges_lock:
+            self._processed_edges.update(edges)
+        return len(edges)
+    
+    def save_processed_edges(self, path: Path):
+        """
+        Write the processed edges to a JSON file.
+        
+        Args:
+            path: Output JSON file path
+        """
+        with self._edges_lock:
+            edges = sorted(self._processed_edges)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        json_utils.dump_file([list(edge) for edge in edges], path, indent=False)
     
     def get_issue_context(self, issue_node_id: str) -> Tuple[str, str, int, int]:
         """
@@ -59,33 +165,43 @@ class RelationshipManager:
         Returns:
             Tuple of (owner, repo, number, databaseId)
         """
-        query = """
-        query($id: ID!) {
-          node(id: $id) {
-            ... on Issue {
-              number
-              databaseId
-              repository {
-                name
-                owner { login }
-              }
-            }
-          }
-        }
+        context = self.get_issue_contexts([issue_node_id]).get(issue_node_id)
+        if context is None:
+            raise RuntimeError(f"Issue not found: {issue_node_id}")
+        return context
+    
+    def get_issue_contexts(self, issue_node_ids: List[str]) -> Dict[str, Tuple[str, str, int, int]]:
         """
+        Get the context of several issues, fetching uncached ones with nodes(ids:).
         
-        data = self.client.graphql(query, {"id": issue_node_id})
-        node = data["node"]
+        Args:
+            issue_node_ids: Issue node IDs
         
-        if not node:
-            raise RuntimeError(f"Issue not found: {issue_node_id}")
+        Returns:
+            Dictionary mapping each found issue node ID to
+            (owner, repo, number, databaseId); unknown IDs are omitted
+        """
+        with self._context_lock:
+            contexts = {i: self._context_cache[i] for i in issue_node_ids if i in self._context_cache}
+        missing = list(dict.fromkeys(i for i in issue_node_ids if i not in contexts))
         
-        owner = node["repository"]["owner"]["login"]
-        repo = node["repository"]["name"]
-        number = int(node["number"])
-        database_id = int(node["databaseId"])
+        for start in range(0, len(missing), MAX_NODES_PER_QUERY):
+            ids = missing[start:start + MAX_NODES_PER_QUERY]
+            # Unknown IDs come back as null nodes with errors; they are just left out
+            data, errors = self.client.graphql_with_errors(_ISSUE_CONTEXTS_QUERY, {"ids": ids})
+            for node in data.get("nodes") or []:
+                if not node or "number" not in node:
+                    continue
+                contexts[node["id"]] = (
+                    node["repository"]["owner"]["login"],
+                    node["repository"]["name"],
+                    int(node["number"]),
+                    int(node["databaseId"])
+                )
         
-        return owner, repo, number, database_id
+        with self._context_lock:
+            self._context_cache.update(contexts)
+        return contexts
     
     def add_sub_issue(
         self,
@@ -102,14 +218,13 @@ class RelationshipManager:
         Returns:
             True if successful
         """
-        edge_key = (parent_issue_id, child_issue_id)
-        if edge_key in self._processed_edges:
+        edge_key = (SUB_ISSUE, parent_issue_id, child_issue_id)
+        if not self._claim_edge(edge_key):
             logger.debug(f"Sub-issue relationship already processed: {parent_issue_id} -> {child_issue_id}")
             return True
         
         if self.processing.dry_run:
             logger.info(f"[DRY RUN] Would add sub-issue: {parent_issue_id} -> {child_issue_id}")
-            self._processed_edges.add(edge_key)
             return True
         
         query = """
@@ -127,12 +242,72 @@ class RelationshipManager:
                 {"parent": parent_issue_id, "child": child_issue_id},
                 features=["sub_issues"]
             )
-            self._processed_edges.add(edge_key)
             return True
         except Exception as e:
+            self._release_edge(edge_key)
             logger.error(f"Failed to add sub-issue: {e}")
             return False
     
+    def add_sub_issues(
+        self,
+        parent_issue_id: str,
+        child_issue_ids: List[str]
+    ) -> Dict[str, bool]:
+        """
+        Add several sub-issues to one parent, batching the addSubIssue mutations.
+        
+        Args:
+            parent_issue_id: Parent issue node ID
+            child_issue_ids: Child issue node IDs
+        
+        Returns:
+            Dictionary mapping each child issue node ID to True if successful
+        """
+        results = {}
+        to_add = []
+        for child_id in dict.fromkeys(child_issue_ids):
+            if self._claim_edge((SUB_ISSUE, parent_issue_id, child_id)):
+                to_add.append(child_id)
+            else:
+                logger.debug(f"Sub-issue relationship already processed: {parent_issue_id} -> {child_id}")
+                results[child_id] = True
+        
+        if self.processing.dry_run:
+            for child_id in to_add:
+                logger.info(f"[DRY RUN] Would add sub-issue: {parent_issue_id} -> {child_id}")
+                results[child_id] = True
+            return results
+        
+        for start in range(0, len(to_add), MAX_SUB_ISSUE_BATCH):
+            batch = to_add[start:start + MAX_SUB_ISSUE_BATCH]
+            fields = []
+            variables = {}
+            for i, child_id in enumerate(batch):
+                alias = f"sub{i}"
+                fields.append((alias, *_ADD_SUB_ISSUE_FIELD))
+                variables.update(alias_variables(alias, {"parent": parent_issue_id, "child": child_id}))
+            
+            try:
+                data, errors = self.client.graphql_with_errors(
+                    build_aliased_document("mutation", fields),
+                    variables,
+                    features=["sub_issues"]
+                )
+            except Exception as e:
+                logger.error(f"Failed to add sub-issues: {e}")
+                data, errors = {}, []
+            
+            failures = alias_failures(data, errors, (f"sub{i}" for i in range(len(batch))))
+            for i, child_id in enumerate(batch):
+                alias = f"sub{i}"
+                success = alias not in failures
+                if not success:
+                    logger.error(f"Failed to add sub-issue {child_id}: {'; '.join(failures[alias]) or 'no data returned'}")
+                    self._release_edge((SUB_ISSUE, parent_issue_id, child_id))
+                results[child_id] = success
+        
+        return results
+    
     def add_blocked_by(
         self,
         blocked_issue_id: str,
@@ -148,30 +323,30 @@ class RelationshipManager:
         Returns:
             True if successful
         """
-        edge_key = (blocked_issue_id, blocker_issue_id)
-        if edge_key in self._processed_edges:
+        edge_key = (BLOCKED_BY, blocked_issue_id, blocker_issue_id)
+        if not self._claim_edge(edge_key):
             logger.debug(f"Blocked-by relationship already processed: {blocked_issue_id} <- {blocker_issue_id}")
             return True
         
         if self.processing.dry_run:
             logger.info(f"[DRY RUN] Would add blocked-by: {blocked_issue_id} <- {blocker_issue_id}")
-            self._processed_edges.add(edge_key)
             return True
         
         try:
-            # Get context for blocked issue
-            blocked_owner, blocked_repo, blocked_number, _ = self.get_issue_context(blocked_issue_id)
-            
-            # Get database ID for blocker issue
-            _, _, _, blocker_dbid = self.get_issue_context(blocker_issue_id)
+            # Context for the blocked issue and database ID of the blocker (one request, cached)
+            contexts = self.get_issue_contexts([blocked_issue_id, blocker_issue_id])
+            for issue_id in (blocked_issue_id, blocker_issue_id):
+                if issue_id not in contexts:
+                    raise RuntimeError(f"Issue not found: {issue_id}")
+            blocked_owner, blocked_repo, blocked_number, _ = contexts[blocked_issue_id]
+            _, _, _, blocker_dbid = contexts[blocker_issue_id]
             
             # Use REST API
             endpoint = f"/repos/{blocked_owner}/{blocked_repo}/issues/{blocked_number}/dependencies/blocked_by"
             self.client.rest_post(endpoint, json_data={"issue_id": blocker_dbid})
-            
-            self._processed_edges.add(edge_key)
             return True
         except Exception as e:
+            self._release_edge(edge_key)
             logger.error(f"Failed to add blocked-by: {e}")
             return False
     
@@ -216,46 +391,90 @@ class RelationshipManager:
         """
         result = RelationshipResult(success=True)
         
+        # Drop edges already processed (earlier rows or a previous run) up front
+        parent_edges = self._filter_new([(SUB_ISSUE, parent_issue_id, issue_id)] if parent_issue_id else [])
+        sub_edges = self._filter_new(
+            (SUB_ISSUE, issue_id, child_id.strip()) for child_id in sub_issue_ids or [] if child_id and child_id.strip()
+        )
+        blocked_by_edges = self._filter_new(
+            (BLOCKED_BY, issue_id, blocker_id.strip()) for blocker_id in blocked_by_ids or [] if blocker_id and blocker_id.strip()
+        )
+        blocking_edges = self._filter_new(
+            (BLOCKED_BY, blocked_id.strip(), issue_id) for blocked_id in blocking_ids or [] if blocked_id and blocked_id.strip()
+        )
+        
+        # Nothing is sent in a dry run, so skip straight to counting the new edges
+        if self.processing.dry_run:
+            return self._dry_run_relationships(parent_edges + sub_edges + blocked_by_edges + blocking_edges)
+        
+        # Look up every issue a dependency needs in one request up front
+        dependency_ids = [blocker_id for _, _, blocker_id in blocked_by_edges] + [b for _, b, _ in blocking_edges]
+        if dependency_ids:
+            try:
+                self.get_issue_contexts([issue_id] + dependency_ids)
+            except Exception as e:
+                logger.warning(f"Failed to prefetch issue contexts: {e}")
+        
         # Parent relationship (this issue is a child of parent)
-        if parent_issue_id:
+        if parent_edges:
             if self.add_sub_issue(parent_issue_id, issue_id):
                 result.relationships_added += 1
             else:
                 result.errors.append(f"Failed to add parent relationship: {parent_issue_id}")
                 result.success = False
         
-        # Sub-issue relationships (these issues are children of this issue)
-        if sub_issue_ids:
-            for child_id in sub_issue_ids:
-                if child_id and child_id.strip():
-                    if self.add_sub_issue(issue_id, child_id.strip()):
-                        result.relationships_added += 1
-                    else:
-                        result.errors.append(f"Failed to add sub-issue: {child_id}")
-                        if not self.processing.continue_on_error:
-                            result.success = False
+        # Sub-issue relationships (these issues are children of this issue),
+        # added in as few requests as possible
+        if sub_edges:
+            added = self.add_sub_issues(issue_id, [child_id for _, _, child_id in sub_edges])
+            for _, _, child_id in sub_edges:
+                if added[child_id]:
+                    result.relationships_added += 1
+                else:
+                    result.errors.append(f"Failed to add sub-issue: {child_id}")
+                    if not self.processing.continue_on_error:
+                        result.success = False
         
         # Blocked-by relationships
-        if blocked_by_ids:
-            for blocker_id in blocked_by_ids:
-                if blocker_id and blocker_id.strip():
-                    if self.add_blocked_by(issue_id, blocker_id.strip()):
-                        result.relationships_added += 1
-                    else:
-                        result.errors.append(f"Failed to add blocked-by: {blocker_id}")
-                        if not self.processing.continue_on_error:
-                            result.success = False
+        for _, _, blocker_id in blocked_by_edges:
+            if self.add_blocked_by(issue_id, blocker_id):
+                result.relationships_added += 1
+            else:
+                result.errors.append(f"Failed to add blocked-by: {blocker_id}")
+                if not self.processing.continue_on_error:
+                    result.success = False
         
         # Blocking relationships
-        if blocking_ids:
-            for blocked_id in blocking_ids:
-                if blocked_id and blocked_id.strip():
-                    if self.add_blocking(issue_id, blocked_id.strip()):
-                        result.relationships_added += 1
-                    else:
-                        result.errors.append(f"Failed to add blocking: {blocked_id}")
-                        if not self.processing.continue_on_error:
-                            result.success = False
+        for _, blocked_id, _ in blocking_edges:
+            if self.add_blocking(issue_id, blocked_id):
+                result.relationships_added += 1
+            else:
+                result.errors.append(f"Failed to add blocking: {blocked_id}")
+                if not self.processing.continue_on_error:
+                    result.success = False
         
         return result
-
+    
+    def _dry_run_relationships(self, edges: List[Tuple[str, str, str]]) -> RelationshipResult:
+        """
+        Record new edges as processed without sending anything.
+        
+        Edges are still claimed so later rows naming the same relationship
+        are counted once, as in a real run.
+        
+        Args:
+            edges: New (kind, source, target) edge keys
+        
+        Returns:
+            RelationshipResult counting every edge claimed
+        """
+        result = RelationshipResult(success=True)
+        for kind, source, target in edges:
+            if not self._claim_edge((kind, source, target)):
+                continue
+            if kind == SUB_ISSUE:
+                logger.info(f"[DRY RUN] Would add sub-issue: {source} -> {target}")
+            else:
+                logger.info(f"[DRY RUN] Would add blocked-by: {source} <- {target}")
+            result.relationships_added += 1
+        return result
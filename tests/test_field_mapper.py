@@ -0,0 +1,52 @@
+"""
+Tests for FieldMapper.
+
+Author: Achal Samarthya
+"""
+
+import pytest
+
+from github_migrator.config import FieldMappingConfig
+from github_migrator.field_mapper import FieldMapper
+
+
+@pytest.fixture
+def mapper():
+    return FieldMapper(FieldMappingConfig())
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024-01-15", "2024-01-15"),
+    (" 2024-01-15 ", "2024-01-15"),
+    ("2024-01-15T10:30:00", "2024-01-15"),
+    ("01/05/2024", "2024-01-05"),
+])
+def test_format_date_normalizes_dates(mapper, value, expected):
+    assert mapper.format_date(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "2024-01-15 to 2024-01-20",
+    "2024-01-15 draft",
+    "2024-01-15T25:99",
+])
+def test_format_date_keeps_free_text_after_date(mapper, value):
+    assert mapper.format_date(value) == value
+
+
+def test_map_series_keeps_equal_values_of_different_types_apart():
+    import pandas as pd
+    
+    results = {"1": "S_ONE", "1.0": "S_ONEF", "True": "S_TRUE"}
+    mapped = FieldMapper.map_series(pd.Series([1, 1.0, True, 1], dtype=object), lambda v: results[str(v)])
+    assert mapped.tolist() == ["S_ONE", "S_ONEF", "S_TRUE", "S_ONE"]
+
+
+def test_map_series_passes_missing_values_through():
+    import pandas as pd
+    
+    calls = []
+    mapped = FieldMapper.map_series(pd.Series(["Done", None], index=[3, 4]), lambda v: calls.append(v) or "S_DONE")
+    assert calls == ["Done"]
+    assert mapped.index.tolist() == [3, 4]
+    assert mapped[3] == "S_DONE" and pd.isna(mapped[4])
@@ -0,0 +1,108 @@
+"""
+Tests for IssueManager.
+
+Author: Achal Samarthya
+"""
+
+import pytest
+
+from github_migrator.config import ProcessingConfig, ProjectConfig
+from github_migrator.issue_manager import IssueManager
+
+
+class StubClient:
+    """Answers aliased mutations, rejecting every alias whose variables hold a "BAD" ID."""
+    
+    def __init__(self, fail_with=None):
+        self.fail_with = fail_with
+        self.calls = []
+    
+    def graphql_with_errors(self, query, variables=None, features=None, timeout=None):
+        self.calls.append(variables)
+        if self.fail_with:
+            raise self.fail_with
+        by_alias = {}
+        for name, value in variables.items():
+            by_alias.setdefault(name.split("_", 1)[0], []).append(value)
+        data, errors = {}, []
+        for alias, values in by_alias.items():
+            if "BAD" in repr(values):
+                data[alias] = None
+                errors.append({"message": "Could not resolve to a node", "path": [alias]})
+            elif alias.startswith("issue"):
+                number = len(self.calls) * 100 + int(alias[len("issue"):])
+                data[alias] = {"issue": {"id": f"I_{number}", "number": number, "url": f"u/{number}"}}
+            elif alias == "project":
+                data[alias] = {"item": {"id": "PVTI_1"}}
+            else:
+                data[alias] = {"clientMutationId": None}
+        return data, errors
+
+
+def _manager(client, **processing):
+    return IssueManager(client, ProjectConfig(), ProcessingConfig(**processing))
+
+
+def test_rejected_label_only_loses_that_label():
+    client = StubClient()
+    specs = [
+        {"repo_id": "R", "title": "ok"},
+        {"repo_id": "R", "title": "bad", "milestone_id": "M1", "assignee_ids": ["U1"], "label_ids": ["BAD", "L2"]},
+    ]
+    
+    results = _manager(client).create_issues_batch(specs)
+    
+    assert [r.success for r in results] == [True, True]
+    assert results[0].errors == []
+    assert results[1].errors == ["Failed to set label BAD: Could not resolve to a node"]
+    # Created again without details, then each detail sent as its own field
+    assert "milestoneId" not in repr(client.calls[1])
+    details = client.calls[2]
+    assert details["milestone_input"]["milestoneId"] == "M1"
+    assert details["assignee0_assigneeIds"] == ["U1"]
+    assert details["label1_labelIds"] == ["L2"]
+    assert results[1].issue_id == details["label1_issueId"]
+
+
+def test_rejected_issue_without_details_is_not_retried():
+    client = StubClient()
+    
+    results = _manager(client).create_issues_batch([{"repo_id": "BAD", "title": "t"}])
+    
+    assert not results[0].success
+    assert len(client.calls) == 1
+
+
+def test_request_failure_is_not_retried():
+    client = StubClient(fail_with=RuntimeError("boom"))
+    
+    results = _manager(client).create_issues_batch([{"repo_id": "R", "title": "t", "label_ids": ["L1"]}])
+    
+    assert not results[0].success and results[0].errors == ["boom"]
+    assert len(client.calls) == 1
+
+
+def _aliases(variables):
+    return sorted({name.split("_", 1)[0] for name in variables})
+
+
+@pytest.mark.parametrize("project_id, sent", [
+    ("P", [["issue0"], ["project"], ["comment0"]]),
+    ("BAD", [["issue0"], ["project"]]),
+])
+def test_comments_wait_for_project_when_stopping_on_error(project_id, sent):
+    client = StubClient()
+    
+    result = _manager(client, continue_on_error=False).create_complete_issue("R", project_id, "t", comments=["c"])
+    
+    assert result.success == (project_id == "P")
+    assert [_aliases(call) for call in client.calls] == sent
+
+
+def test_comments_go_with_project_when_continuing_on_error():
+    client = StubClient()
+    
+    result = _manager(client).create_complete_issue("R", "BAD", "t", comments=["c"])
+    
+    assert result.errors[0] == "Failed to add issue to project"
+    assert _aliases(client.calls[1]) == ["comment0", "project"]